@@ -160,6 +160,9 @@ Press 'L' to toggle logging on/off
     def spatial(self, source: str, pan: float, volume: float, distance: float,
                 angle: float = None, altitude_diff: float = None):
         """Log spatial audio positioning."""
+        # Per-frame callers: bail out before formatting when logging is off
+        if not self.config.enabled:
+            return
         pan_indicator = self._pan_indicator(pan)
         msg = f"{source:15} | pan:{pan:+5.2f} {pan_indicator} | vol:{volume:4.2f} | dist:{distance:5.1f}m"
         if angle is not None and self.config.detail_level >= 1:
@@ -173,6 +176,8 @@ Press 'L' to toggle logging on/off
                   rear_factor: float = None, volume_mult: float = None,
                   is_interpolating: bool = False):
         """Log occlusion/directional filtering."""
+        if not self.config.enabled:
+            return
         cutoff_hz = int(lowpass_gain * 22000)
         direction = self._angle_to_direction(angle)
         msg = f"{source:15} | angle:{angle:+6.1f} ({direction:6}) | cutoff:{cutoff_hz:5}Hz"
@@ -186,6 +191,8 @@ Press 'L' to toggle logging on/off
 
     def reverb(self, source: str, distance: float, wet_db: float, decay_ms: float):
         """Log distance-based reverb settings."""
+        if not self.config.enabled:
+            return
         msg = f"{source:15} | dist:{distance:5.1f}m | wet:{wet_db:+5.1f}dB | decay:{decay_ms:5.0f}ms"
         self._log(LogCategory.REVERB, msg, f"reverb_{source}")
 
@@ -200,6 +207,8 @@ Press 'L' to toggle logging on/off
             speed: Speed of moving source (optional)
             speed_boost: Additional pitch from speed (optional)
         """
+        if not self.config.enabled:
+            return
         msg = f"{source:15} | dist:{distance:5.1f}m | pitch:{base_pitch:5.3f}"
         if speed is not None and self.config.detail_level >= 1:
             msg += f" | speed:{speed:5.1f}"
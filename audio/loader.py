@@ -701,6 +701,27 @@ class SoundLoader:
 
         return None
 
+    def get_drone_sound_variants(self, category: str) -> tuple:
+        """Get every sound in a drone category.
+
+        Lets callers that draw from the same category on every event resolve
+        it once and pick from the tuple themselves.
+
+        Args:
+            category: Sound category (beacons, explosions, etc.)
+
+        Returns:
+            Tuple of Sound objects (empty if the category is missing)
+        """
+        self._ensure_drone_sounds_loaded()
+
+        sounds = self.sounds.get('drones', {}).get(category)
+        if sounds is None:
+            return ()
+        if not isinstance(sounds, list):
+            return (sounds,)
+        return tuple(sounds)
+
     def get_damaged_sound(self):
         """Get a random damage sound."""
         damaged = self.sounds.get('damaged', [])
@@ -19,30 +19,108 @@ from state.constants import (
 
 
 class Drone:
-    """Represents an enemy combat drone."""
-
-    def __init__(self, drone_id: int, x: float, y: float, spawn_distance: float):
+    """Represents an enemy combat drone.
+
+    OPTIMIZATION: Uses __slots__ so the many per-frame field reads in
+    DroneManager are attribute slot loads instead of dict lookups, and each
+    drone carries no per-instance __dict__. Every field is initialized in
+    __init__; fields that are only meaningful in some states use None as
+    the "not set" sentinel.
+    """
+
+    __slots__ = (
+        # Identity and core state
+        'id', 'state', 'state_start', 'state_duration', 'health',
+        # Position and movement
+        'x', 'y', 'altitude', 'speed', 'base_speed', 'climb_rate',
+        'prev_x', 'prev_y', 'prev_altitude', 'velocity',
+        # Cached spatial audio values (updated once per frame)
+        'distance', 'relative_angle', 'altitude_diff', 'pan', 'raw_pan', 'vol',
+        'pitch_params',
+        # Tracking
+        'last_known_x', 'last_known_y', 'patrol_target',
+        'last_sound_update', 'last_sound_reaction', 'attack_cooldown',
+        # Personality
+        'personality', 'personality_data', 'accuracy_mult', 'aggression',
+        'evasion_skill', 'hesitation_chance',
+        # Evasion and flanking
+        'evasion_interval', 'evasion_timer', 'evasion_direction',
+        'evasion_angle_offset', 'evasion_rotation', 'flank_angle_offset', 'flank_distance',
+        'target_separation', 'circle_direction', '_circling_toward',
+        'feint_pending', 'feint_timer', 'target_flank_altitude',
+        # Attack bursts
+        'attack_weapon', 'shots_to_fire', 'shots_fired', 'last_shot_time',
+        'hits_this_burst', 'hits_landed', 'hit_chance', 'interval_min',
+        'interval_max', 'next_shot_interval', 'shot_intervals', 'attack_frustrated',
+        'hold_fire_until', 'cooldown_duration', 'last_peek_time',
+        'last_attack_x', 'last_attack_y',
+        # Attack adaptation
+        'weapon_history', 'preferred_range', '_avoid_weapon', '_avoid_distance',
+        '_effective_weapon', '_effective_distance',
+        # Coordination
+        'tactic_role', '_last_coordination', 'in_coordinated_assault',
+        'assault_partner_id', 'assault_converge_angle',
+        '_flank_partner', '_flank_partner_until',
+        # State transition flags
+        'hesitating', 'false_start', 'had_false_start', 'confused_until',
+        # Search pattern
+        'search_pattern', 'search_waypoints', 'search_waypoint_index',
+        'search_expand_count', 'last_search_expand',
+        # Wounded / suppression / distress
+        'is_wounded', 'wounded_erratic_timer', 'is_suppressed',
+        'suppression_end_time', 'suppression_cooldown_end', 'recent_damage',
+        'damage_window_start', 'distress_active', 'distress_start_time',
+        # Audio
+        '_channel_ids', '_channels', '_fadeable_channels', '_filter_last',
+        '_position_last', 'takeoff_playing',
+        # Level of detail
+        'update_rate', 'lod_dt', 'step_dt',
+    )
+
+    def __init__(self, drone_id: int, x: float, y: float, spawn_distance: float,
+                 altitude: float = None, speed: float = None):
         """Initialize a drone.
 
         Args:
-            drone_id: Unique drone ID (0 or 1)
+            drone_id: Unique drone ID (audio pool slot)
             x: Spawn X position
             y: Spawn Y position
             spawn_distance: Initial distance from player
+            altitude: Spawn altitude in feet (random 30-80 ft if None)
+            speed: Movement speed (randomized around DRONE_BASE_SPEED if None)
+        """
+        # Channel IDs depend only on the drone ID, so they survive reset()
+        self._channel_ids = None
+        self.reset(drone_id, x, y, spawn_distance, altitude, speed)
+
+    def reset(self, drone_id: int, x: float, y: float, spawn_distance: float,
+              altitude: float = None, speed: float = None):
+        """Re-initialize every field in place for a fresh spawn.
+
+        Lets DroneManager reuse pooled Drone objects instead of allocating
+        a new one per spawn. Arguments are the same as for __init__.
         """
         self.id = drone_id
         self.x = x
         self.y = y
-        self.altitude = random.uniform(30, 80)  # 30-80 ft altitude
+        self.altitude = random.uniform(30, 80) if altitude is None else altitude  # 30-80 ft altitude
 
         self.health = 100.0
         self.state = 'spawning'
         self.state_start = 0
+        self.state_duration = None
 
-        self.speed = DRONE_BASE_SPEED + random.uniform(-1, 1)
+        self.speed = DRONE_BASE_SPEED + random.uniform(-1, 1) if speed is None else speed
+        self.base_speed = self.speed
         self.climb_rate = DRONE_CLIMB_RATE
         self.attack_cooldown = 0
 
+        # Velocity tracking for Doppler effect
+        self.prev_x = x
+        self.prev_y = y
+        self.prev_altitude = self.altitude
+        self.velocity = (0.0, 0.0, 0.0)  # (vx, vy, vz) in meters/second
+
         # Tracking data
         self.distance = spawn_distance
         self.relative_angle = 0.0
@@ -51,13 +129,109 @@ class Drone:
         self.last_known_y = y
         self.patrol_target = (x, y)
 
+        # Cached spatial audio (pan None until the first spatial update)
+        self.pan = None
+        self.raw_pan = 0.0
+        self.vol = 0.0
+        # (pitch, speed_boost) from the last spatial update
+        self.pitch_params = (1.0, 0.0)
+
+        # Personality (neutral until assigned by the manager)
+        self.personality = 'veteran'
+        self.personality_data = None
+        self.accuracy_mult = 1.0
+        self.aggression = 0.5
+        self.evasion_skill = 1.0
+        self.hesitation_chance = 0.0
+
         # Evasion state
-        self.evasion_direction = random.choice([-1, 1])  # Left or right
+        self.evasion_direction = 1 - (random.getrandbits(1) << 1)  # Left or right
         self.evasion_timer = 0
+        self.evasion_interval = 0.5
+        self.evasion_angle_offset = None
+        self.evasion_rotation = None  # (cos, sin) of evasion_angle_offset
         self.flank_angle_offset = 0  # Angle offset for flanking maneuvers
+        self.flank_distance = None
+        self.target_separation = None
+        self.circle_direction = None
+        self._circling_toward = False
+        self.feint_pending = False
+        self.feint_timer = 0.0
+        self.target_flank_altitude = None
+
+        # Attack bursts
+        self.attack_weapon = 'pulse_cannon'
+        self.shots_to_fire = 0
+        self.shots_fired = 0
+        self.last_shot_time = 0
+        self.hits_this_burst = 0
+        self.hits_landed = 0
+        self.hit_chance = 0.5
+        self.interval_min = 80
+        self.interval_max = 120
+        self.next_shot_interval = 80
+        self.shot_intervals = ()  # Pre-drawn per-shot intervals for the current burst
+        self.attack_frustrated = False
+        self.hold_fire_until = 0
+        self.cooldown_duration = 300
+        self.last_peek_time = None
+        self.last_attack_x = None
+        self.last_attack_y = None
+
+        # Attack adaptation
+        self.weapon_history = []
+        self.preferred_range = None
+        self._avoid_weapon = None
+        self._avoid_distance = None
+        self._effective_weapon = None
+        self._effective_distance = None
+
+        # Coordination
+        self.tactic_role = None  # 'primary', 'support', 'flanker'
+        self._last_coordination = 0
+        self.in_coordinated_assault = False
+        self.assault_partner_id = None
+        self.assault_converge_angle = 0
+        self._flank_partner = None  # Nearest engaging drone, held for PARTNER_HOLD_MS
+        self._flank_partner_until = 0
+
+        # State transition flags
+        self.hesitating = False
+        self.false_start = False
+        self.had_false_start = False
+        self.confused_until = 0
+
+        # Search pattern
+        self.search_pattern = None
+        self.search_waypoints = []
+        self.search_waypoint_index = 0
+        self.search_expand_count = 0
+        self.last_search_expand = 0
+
+        # Wounded / suppression / distress
+        self.is_wounded = False
+        self.wounded_erratic_timer = 0.0
+        self.is_suppressed = False
+        self.suppression_end_time = 0
+        self.suppression_cooldown_end = 0
+        self.recent_damage = 0
+        self.damage_window_start = 0
+        self.distress_active = False
+        self.distress_start_time = 0
 
         # Audio tracking
         self.last_sound_update = 0
+        self.last_sound_reaction = 0
+        self._channels = None  # Audio channel dict, set while the drone is live
+        self._fadeable_channels = ()  # Channels that need update_fade() each frame
+        self._filter_last = {}  # channel_type -> (angle, altitude_diff, distance, time) last filtered
+        self._position_last = {}  # channel_type -> (x, y, altitude_m, velocity) last sent to FMOD
+        self.takeoff_playing = False
+
+        # Level of detail: update every Nth frame, dt banked while skipped
+        self.update_rate = 1
+        self.lod_dt = 0.0
+        self.step_dt = 0.016
 
     def to_dict(self) -> dict:
         """Convert drone to dictionary (for compatibility with existing code).
@@ -112,7 +286,7 @@ class Drone:
         drone.last_known_y = data.get('last_known_y', drone.y)
         drone.patrol_target = data.get('patrol_target', (drone.x, drone.y))
         drone.last_sound_update = data.get('last_sound_update', 0)
-        drone.evasion_direction = data.get('evasion_direction', random.choice([-1, 1]))
+        drone.evasion_direction = data.get('evasion_direction', 1 - (random.getrandbits(1) << 1))
         drone.evasion_timer = data.get('evasion_timer', 0)
         drone.flank_angle_offset = data.get('flank_angle_offset', 0)
         return drone
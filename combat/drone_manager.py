@@ -4,13 +4,16 @@ Drone Manager for MechSimulator.
 Handles drone spawning, updates, audio, and combat.
 """
 
+import bisect
 import math
 import random
+from collections import deque
+from operator import attrgetter
 
 from state.constants import (
     DRONE_SPAWN_INTERVAL,
     DRONE_SPAWN_DISTANCE_MIN, DRONE_SPAWN_DISTANCE_MAX,
-    DRONE_WEAPONS, BASE_VOLUMES, AIM_ASSIST_COOLDOWN,
+    DRONE_WEAPONS, BASE_VOLUMES, AIM_ASSIST_COOLDOWN, AIM_ASSIST_RANGE,
     TARGET_LOCK_ANGLE, TARGET_LOCK_COOLDOWN,
     DRONE_ATTACK_WINDUP_MS, DRONE_ATTACK_WINDUP_ENABLED,
     # AI Personalities
@@ -58,9 +61,26 @@ from state.constants import (
     CAMO_SOUND_DETECTION_RANGE_MULT, CAMO_PROXIMITY_WARNING_ENABLED,
     CAMO_PROXIMITY_WARNING_RANGE, CAMO_PROXIMITY_WARNING_INTERVAL,
     CAMO_AMBUSH_ENABLED, CAMO_AMBUSH_DAMAGE_MULT,
-    CAMO_CONFUSION_ENABLED, CAMO_CONFUSION_DURATION, CAMO_CONFUSION_LOSE_LOCK_RANGE
+    CAMO_CONFUSION_ENABLED, CAMO_CONFUSION_DURATION, CAMO_CONFUSION_LOSE_LOCK_RANGE,
+    # Hit confirmation
+    HIT_CONFIRM_DAMAGE_THRESHOLDS, HIT_CONFIRM_KILL_SOUND,
+    # Update level of detail
+    DRONE_ATTACK_RANGE, AUDIO_DISTANCE_FAR, DRONE_LOD_MEDIUM_RATE, DRONE_LOD_FAR_RATE,
+    # State machine ranges and timings (moved from function-level imports)
+    DRONE_DETECT_RANGE, DRONE_LOSE_TRACK_RANGE, DRONE_REACQUIRE_RANGE,
+    DRONE_CAMO_DETECT_RANGE, DRONE_CAMO_LOSE_TRACK_RANGE, DRONE_CAMO_REACQUIRE_RANGE,
+    DRONE_ATTACK_STATE_DURATION, DRONE_COOLDOWN_MIN, DRONE_COOLDOWN_MAX, ALTITUDE_MAX,
+    # Dynamic pitch
+    AUDIO_DISTANCE_CLOSE, AUDIO_DISTANCE_MEDIUM,
+    AUDIO_PITCH_CLOSE, AUDIO_PITCH_MEDIUM, AUDIO_PITCH_FAR,
+    AUDIO_SPEED_THRESHOLD, AUDIO_SPEED_PITCH_BOOST, AUDIO_LOG_SAMPLE_RATE,
+    # Debug output
+    DRONE_DEBUG_PRINTS,
+    # Audio culling
+    DRONE_AUDIBLE_RANGE,
 )
 from audio.spatial import SpatialAudio
+from combat.drone import Drone
 
 # Audio logging (lazy import)
 _audio_log = None
@@ -83,12 +103,222 @@ def _get_audio_log():
     return _audio_log
 
 
+# OPTIMIZATION: Module-level bindings for functions called in per-frame paths
+# (one LOAD_GLOBAL instead of a global lookup plus attribute lookup)
+_sin = math.sin
+_cos = math.cos
+_radians = math.radians
+_atan2 = math.atan2
+_hypot = math.hypot
+_sqrt = math.sqrt
+_random = random.random
+_randint = random.randint
+_choice = random.choice
+_getrandbits = random.getrandbits
+
+# Spawn and flanking parameter ranges, scaled from a single random() draw each
+_SPAWN_DISTANCE_SPAN = DRONE_SPAWN_DISTANCE_MAX - DRONE_SPAWN_DISTANCE_MIN
+_EVASION_INTERVAL_SPAN = EVASION_INTERVAL_MAX - EVASION_INTERVAL_MIN
+_FLANK_SEPARATION_SPAN = FLANK_SEPARATION_MAX - FLANK_SEPARATION_MIN
+_FLANK_DISTANCE_SPAN = FLANK_DISTANCE_MAX - FLANK_DISTANCE_MIN
+_ALTITUDE_FLANK_OFFSET_SPAN = ALTITUDE_FLANK_OFFSET_MAX - ALTITUDE_FLANK_OFFSET_MIN
+_EVASION_ANGLE_SPAN = 2 * EVASION_ANGLE_VARIANCE
+
+# OPTIMIZATION: Random patrol/wander headings pick from a precomputed ring of
+# (sin, cos) pairs (256 headings, ~1.4 degrees apart) instead of calling trig
+_HEADING_RING_BITS = 8
+_HEADING_RING = tuple(
+    (math.sin(i * math.tau / (1 << _HEADING_RING_BITS)),
+     math.cos(i * math.tau / (1 << _HEADING_RING_BITS)))
+    for i in range(1 << _HEADING_RING_BITS)
+)
+
+# Spiral search directions: 72 degrees per step (5 steps = full circle)
+_SPIRAL_DIRS = tuple(
+    (math.sin(math.radians(i * 72)), math.cos(math.radians(i * 72))) for i in range(5)
+)
+
+# Flanking circle speed is fixed config - convert to radians once
+_FLANK_CIRCLE_SPEED_RAD = math.radians(FLANK_CIRCLE_SPEED)
+
+# Flank separation thresholds (with 10 degree hysteresis) in radians, so the
+# per-frame separation check never converts degrees
+_FLANK_TOO_CLOSE_RAD = math.radians(FLANK_SEPARATION_MIN - 10)
+_FLANK_TOO_FAR_RAD = math.radians(FLANK_SEPARATION_MAX + 10)
+_PI = math.pi
+_TAU = math.tau
+
+# Drone state groups for membership tests
+# OPTIMIZATION: frozensets built once at import - each test is one hashed
+# probe instead of a left-to-right tuple scan
+# Partner states for flanking (engaging only) and tactical coordination;
+# combat states also keep evading while suppressed
+_ENGAGING_STATES = frozenset({'engaging'})
+_COMBAT_STATES = frozenset({'engaging', 'attacking', 'winding_up'})
+# Partner is mid-attack (coordinated timing)
+_FIRING_STATES = frozenset({'attacking', 'winding_up'})
+# Not yet (or no longer) reacting to the player
+_INERT_STATES = frozenset({'spawning', 'destroyed'})
+# States with looping ambient audio, and the aggressive subset that uses supersonics
+_AMBIENT_STATES = frozenset({'patrol', 'detecting', 'engaging', 'attacking', 'cooldown'})
+_SUPERSONIC_STATES = frozenset({'engaging', 'attacking'})
+
+# Sound reaction dodge scaling by player weapon: (multiplier, max chance)
+_DODGE_SCALING = {
+    'missiles': (1.5, 0.9),  # More likely to dodge missiles
+    'emp': (1.3, 0.8),       # EMP is scary
+}
+
+# State machine ranges indexed by camo_effective (False -> normal, True -> camo)
+_DETECT_RANGE = (DRONE_DETECT_RANGE, DRONE_CAMO_DETECT_RANGE)
+_LOSE_TRACK_RANGE = (DRONE_LOSE_TRACK_RANGE, DRONE_CAMO_LOSE_TRACK_RANGE)
+_REACQUIRE_RANGE = (DRONE_REACQUIRE_RANGE, DRONE_CAMO_REACQUIRE_RANGE)
+
+# Feet to meters (game altitudes are in feet) - multiply instead of dividing by 3.28
+_FT_TO_M = 1.0 / 3.28
+
+# Key getters for the per-frame distance index and aim assist
+_distance_key = attrgetter('distance')
+_angle_key = attrgetter('relative_angle')
+
+# Passive states (never a threat to the player): eligible for level-of-detail
+# throttling, sound-based detection and answering distress calls
+_PASSIVE_STATES = frozenset({'patrol', 'searching'})
+
+# Shared velocity tuple for stationary drones (tuples are immutable, safe to share)
+_ZERO_VELOCITY = (0.0, 0.0, 0.0)
+
+# Drone base volume is fixed config - resolve the dict lookup once at import
+_DRONE_BASE_VOLUME = BASE_VOLUMES.get('drone', 0.8)
+
+# Fallback weapon selection by distance: bucket upper bounds and, per bucket,
+# (chance, likely, other)
+# OPTIMIZATION: One random() draw against a fixed weight instead of building a
+# weighted list for _choice() on every shot; the bucket is found by bisect
+_WEAPON_BUCKET_LIMITS = (15, 25, 35, 45)
+_WEAPON_BUCKETS = (
+    (2 / 3, 'pulse_cannon', 'plasma_launcher'),
+    (1 / 3, 'pulse_cannon', 'plasma_launcher'),
+    (2 / 3, 'plasma_launcher', 'rail_gun'),
+    (2 / 3, 'rail_gun', 'plasma_launcher'),
+)
+
+# Personality weapon preferences flattened to (weapon, min_range, max_range)
+# tuples so _select_weapon filters them without unpacking nested dict items
+_WEAPON_RANGES = {
+    personality: tuple((weapon, lo, hi) for weapon, (lo, hi) in prefs.items())
+    for personality, prefs in PERSONALITY_WEAPON_PREFS.items()
+}
+
+# Common divisor of the personality weights (shrinks the weighted pick table)
+_PERSONALITY_WEIGHT_GCD = math.gcd(*DRONE_PERSONALITY_WEIGHTS.values())
+
+# Hit confirmation volume by damage tier: light, heavy (25+), critical (50+), massive (75+)
+# OPTIMIZATION: bisect over the thresholds instead of an elif staircase
+_HIT_THRESHOLDS = tuple(HIT_CONFIRM_DAMAGE_THRESHOLDS)
+_HIT_VOLUMES = (0.4, 0.6, 0.75, 0.9)
+
+# Dynamic pitch curve: higher when close, lower (extra low for very far) when distant
+# OPTIMIZATION: Breakpoints and per-segment slopes are fixed config - build them once
+# and bisect instead of re-deriving the interpolation factors in a branch cascade
+_PITCH_XP = (0.0, AUDIO_DISTANCE_CLOSE, AUDIO_DISTANCE_MEDIUM, AUDIO_DISTANCE_FAR)
+_PITCH_FP = (AUDIO_PITCH_CLOSE, AUDIO_PITCH_MEDIUM, AUDIO_PITCH_FAR, AUDIO_PITCH_FAR * 0.98)
+_PITCH_SLOPES = tuple(
+    (_PITCH_FP[i + 1] - _PITCH_FP[i]) / (_PITCH_XP[i + 1] - _PITCH_XP[i])
+    for i in range(len(_PITCH_XP) - 1)
+)
+_PITCH_POINTS = len(_PITCH_XP)
+
+
+def _curve_pitch(distance: float) -> float:
+    """Evaluate the piecewise-linear distance pitch curve (flat past the end)."""
+    i = bisect.bisect_right(_PITCH_XP, distance)
+    if i < _PITCH_POINTS:
+        i -= 1
+        return _PITCH_FP[i] + (distance - _PITCH_XP[i]) * _PITCH_SLOPES[i]
+    return _PITCH_FP[-1]
+
+
+# OPTIMIZATION: The curve is sampled once into a 256-entry table over
+# [0, AUDIO_DISTANCE_FAR] (~0.0006 pitch per step, well below audible), so the
+# per-frame lookup is one scaled index instead of a bisect and interpolation
+_PITCH_LUT_SIZE = 256
+_PITCH_LUT_MAX = _PITCH_LUT_SIZE - 1
+_PITCH_LUT_SCALE = _PITCH_LUT_MAX / AUDIO_DISTANCE_FAR
+_PITCH_LUT = tuple(_curve_pitch(i / _PITCH_LUT_SCALE) for i in range(_PITCH_LUT_SIZE))
+
+# Speed above which drones get a pitch boost, squared for sqrt-free comparison
+_AUDIO_SPEED_THRESHOLD_SQ = AUDIO_SPEED_THRESHOLD * AUDIO_SPEED_THRESHOLD
+
+# Drone channels with fade in/out transitions, advanced every frame
+_FADE_CHANNELS = ('ambient', 'combat', 'takeoff', 'passby', 'supersonic')
+
+
+def _pitch_params(distance: float, velocity: tuple) -> tuple:
+    """Compute dynamic pitch for a drone from its distance and velocity.
+
+    Higher pitch when close, lower when far, plus a boost when the drone
+    is moving fast (charging).
+
+    Args:
+        distance: Distance to drone in meters
+        velocity: (vx, vy, vz) in meters/second
+
+    Returns:
+        Tuple of (pitch, speed_boost)
+    """
+    # Distance pitch curve from the table (nearest sample), flat beyond the end
+    i = int(distance * _PITCH_LUT_SCALE + 0.5)
+    pitch = _PITCH_LUT[i if i < _PITCH_LUT_MAX else _PITCH_LUT_MAX]
+
+    # OPTIMIZATION: Compare squared speed against the threshold so the square
+    # root is only taken for fast drones (most frames are below it)
+    vx, vy, vz = velocity
+    speed_sq = vx * vx + vy * vy + vz * vz
+
+    boost = 0.0
+    if speed_sq > _AUDIO_SPEED_THRESHOLD_SQ:
+        # Drone is moving fast - add urgency via pitch boost
+        speed = _sqrt(speed_sq)
+        speed_factor = min(1.0, (speed - AUDIO_SPEED_THRESHOLD) / AUDIO_SPEED_THRESHOLD)
+        boost = speed_factor * AUDIO_SPEED_PITCH_BOOST
+        pitch += boost
+
+    return pitch, boost
+
+
 class DroneManager:
     """Manages all drone entities and their behavior."""
 
+    # OPTIMIZATION: Fixed attribute layout - instance state lives in slots
+    # rather than a per-instance __dict__. Class-level tuning constants below
+    # are class attributes and must not be listed here. Add new instance
+    # attributes to this tuple when introducing them in __init__.
+    __slots__ = (
+        'audio', 'sounds', 'tts', 'state',
+        'drones', 'spawn_timer', 'spatial',
+        '_drone_pool', '_drone_slots', '_free_drone_ids',
+        '_cached_active_drones',
+        '_drones_by_distance', '_dist_keys',
+        '_player_x', '_player_y', '_player_altitude', '_player_facing',
+        '_tts_queue', '_tts_last_time', '_tts_last_text',
+        '_current_time', '_frame_dt', '_frame_count', '_last_listener',
+        '_state_handlers', '_sound_variants',
+    )
+
     # Panning update threshold (radians) - only update if angle changed significantly
     PAN_UPDATE_THRESHOLD = 0.05  # ~3 degrees
 
+    # Directional filter reapplication gates for continuously positioned channels
+    FILTER_ANGLE_GATE = math.degrees(PAN_UPDATE_THRESHOLD)  # relative_angle is in degrees
+    FILTER_ALTITUDE_GATE = 2.0    # Altitude difference change (feet)
+    FILTER_DISTANCE_GATE = 1.0    # Distance change (meters)
+    FILTER_REFRESH_MS = 250       # Reapply at least this often so occlusion keeps interpolating
+
+    # 3D position resend gate for continuously positioned channels
+    POSITION_GATE_SQ = 0.25       # Squared move (m^2) below which FMOD keeps the old position (0.5 m)
+    POSITION_CATCHUP_DT = 0.1     # Always resend after a long frame (seconds)
+
     # Pan smoothing factor (0-1): higher = smoother but slower response
     # 0.75 means 75% old value + 25% new value per frame (smooth transitions)
     PAN_SMOOTHING_FACTOR = 0.75
@@ -97,11 +327,38 @@ class DroneManager:
     TAKEOFF_FADE_IN_MS = 300      # Fade in for drone spawn/takeoff sounds
     PASSBY_FADE_IN_MS = 500       # Fade in for patrol passby sounds (longer for smooth entry)
     SUPERSONIC_FADE_IN_MS = 350   # Fade in for engaging supersonic sounds (smoother transition)
+
+    # Tactical coordination check interval per engaging drone (milliseconds)
+    COORDINATION_INTERVAL_MS = 200
+
+    # How long a flanking drone keeps its chosen partner before re-picking
+    # the nearest one (stops partner swaps between similar distances)
+    PARTNER_HOLD_MS = 1000
+
+    # Combat TTS pacing (milliseconds)
+    TTS_MIN_GAP_MS = 300          # Minimum spacing between queued announcements
+    TTS_COALESCE_MS = 500         # Repeats of the same text within this window are dropped
+    # Announcements that make still-queued ones redundant (a kill outranks "critical")
+    TTS_SUPERSEDES = {'Hostile destroyed': ('Hostile critical',)}
     AMBIENT_CROSSFADE_MS = 400    # Crossfade between ambient sounds (reduced audio dropouts)
 
     # Cached personality selection data (avoid recreating lists each spawn)
-    _PERSONALITY_TYPES = list(DRONE_PERSONALITY_WEIGHTS.keys())
-    _PERSONALITY_WEIGHTS = list(DRONE_PERSONALITY_WEIGHTS.values())
+    # OPTIMIZATION: Weights are integer counts, so a table with each personality
+    # repeated by its weight gives an O(1) weighted pick via _choice(). Weights
+    # are divided by their GCD first, so 30/45/15/10 becomes a 20-entry table.
+    _PERSONALITY_TABLE = tuple(
+        name for name, weight in DRONE_PERSONALITY_WEIGHTS.items()
+        for _ in range(weight // _PERSONALITY_WEIGHT_GCD)
+    )
+    # name -> (data, speed_mult, accuracy_mult, aggression, evasion_skill,
+    #          1 / evasion_skill, hesitation_chance), resolved once at class load
+    _PERSONALITY_CACHE = {
+        name: (
+            p, p['speed_mult'], p['accuracy_mult'], p['aggression'], p['evasion_skill'],
+            1.0 / p['evasion_skill'], p.get('hesitation_chance', HESITATION_CHANCE)
+        )
+        for name, p in DRONE_PERSONALITIES.items()
+    }
 
     def __init__(self, audio_manager, sound_loader, tts, game_state):
         """Initialize the drone manager.
@@ -124,9 +381,17 @@ class DroneManager:
         # Drone audio pool (set via set_drone_pool after config menu)
         self._drone_pool = None
 
-        # Cached active drones list (updated once per frame)
-        self._cached_active_drones = []
-        self._active_drones_dirty = True
+        # Drone object pool: slot index == drone ID, free IDs reused first
+        self._drone_slots = []
+        self._free_drone_ids = deque()
+
+        # Active (non-destroyed) drones, kept current by spawn/destroy
+        self._cached_active_drones = ()
+
+        # OPTIMIZATION: Active drones sorted by distance (rebuilt once per frame)
+        # with a parallel key list so range queries can bisect instead of scanning
+        self._drones_by_distance = []
+        self._dist_keys = []
 
         # OPTIMIZATION: Cached player position (updated once per frame)
         self._player_x = 0.0
@@ -134,6 +399,32 @@ class DroneManager:
         self._player_altitude = 0.0
         self._player_facing = 0.0
 
+        # Listener pose used by the last spatial batch (None forces a full recompute)
+        self._last_listener = None
+
+        # Per-state behavior, dispatched from _update_drone_state()
+        self._state_handlers = {
+            'spawning': self._tick_spawning,
+            'patrol': self._tick_patrol,
+            'detecting': self._tick_detecting,
+            'engaging': self._tick_engaging,
+            'winding_up': self._tick_winding_up,
+            'searching': self._tick_searching,
+            'attacking': self._tick_attacking,
+            'cooldown': self._tick_cooldown,
+        }
+
+        # Drone sound category -> tuple of variants, resolved on first use
+        self._sound_variants = {}
+
+        # Debounced combat announcements (drained by tick_tts each frame)
+        self._tts_queue = deque()
+        self._tts_last_time = 0
+        self._tts_last_text = None
+        self._current_time = 0
+        self._frame_dt = 0.016
+        self._frame_count = 0
+
     def set_drone_pool(self, pool):
         """Set the drone audio pool (called after config menu).
 
@@ -141,6 +432,9 @@ class DroneManager:
             pool: DroneAudioPool instance
         """
         self._drone_pool = pool
+        # Drone count may have changed - rebuild the object pool on demand
+        self._drone_slots = []
+        self._free_drone_ids.clear()
 
     @property
     def max_drones(self) -> int:
@@ -162,22 +456,6 @@ class DroneManager:
             return self._drone_pool.get_channels(drone_id)
         return self.audio.get_drone_channels(drone_id)
 
-    def _update_drone_fades(self, dt: float):
-        """Update fade states for all active drone audio channels.
-
-        Must be called each frame to process fade in/out transitions.
-
-        Args:
-            dt: Delta time in seconds
-        """
-        for drone in self.drones:
-            dc = self._get_drone_channels(drone['id'])
-            if dc:
-                # Update fade for all drone channels
-                for channel_name in ['ambient', 'combat', 'takeoff', 'passby', 'supersonic']:
-                    if channel_name in dc and hasattr(dc[channel_name], 'update_fade'):
-                        dc[channel_name].update_fade(dt)
-
     def update(self, current_time: int, dt: float, damage_system, camo_system) -> list:
         """Update all drones.
 
@@ -194,6 +472,8 @@ class DroneManager:
             return []
 
         events = []
+        self._current_time = current_time
+        self._frame_dt = dt
 
         # OPTIMIZATION: Cache player position once at frame start
         self._player_x = self.state.player_x
@@ -201,195 +481,246 @@ class DroneManager:
         self._player_altitude = self.state.player_altitude
         self._player_facing = self.state.facing_angle
 
-        # Mark active drones cache as dirty at start of frame
-        self._active_drones_dirty = True
-
-        # Update fade states for all drone audio channels
-        self._update_drone_fades(dt)
-
-        # Spawn check - use cached active count
+        # Spawn check - use the incrementally maintained active count
         if current_time - self.spawn_timer >= DRONE_SPAWN_INTERVAL:
             self.spawn_timer = current_time
-            if len(self._get_active_drones_cached()) < self.max_drones:
+            if len(self._cached_active_drones) < self.max_drones:
                 drone = self._spawn_drone(current_time)
                 if drone:
                     events.append(('spawn', drone))
 
+        # Update spatial audio for all active drones in one pass (pass dt for velocity)
+        self._update_spatial_audio_batch(self._cached_active_drones, dt)
+
         # Update each drone
-        drones_to_remove = []
-        for drone in self.drones:
-            if drone['state'] == 'destroyed':
+        # OPTIMIZATION: Finished drones are dropped by compacting self.drones in
+        # place during this same pass (write index trails the read position),
+        # so there is no second removal pass and no per-item list.remove()
+        self._frame_count += 1
+        frame = self._frame_count
+        drones = self.drones
+        keep = 0
+        for drone in drones:
+            # Advance fade in/out transitions on this drone's channels
+            # OPTIMIZATION: Done here rather than in a separate pass over
+            # self.drones, using the fadeable channels resolved at spawn
+            for channel in drone._fadeable_channels:
+                channel.update_fade(dt)
+
+            if drone.state == 'destroyed':
                 # Check if all destruction sounds have finished
                 # Use pool's is_drone_silent if available, else fallback
                 if self._drone_pool:
-                    if self._drone_pool.is_drone_silent(drone['id']):
-                        drones_to_remove.append(drone)
+                    silent = self._drone_pool.is_drone_silent(drone.id)
+                else:
+                    dc = drone._channels
+                    silent = dc and not dc['combat'].get_busy() and not dc['ambient'].get_busy()
+                if silent:
+                    self._release_drone(drone)
                 else:
-                    dc = self._get_drone_channels(drone['id'])
-                    if dc and not dc['combat'].get_busy() and not dc['ambient'].get_busy():
-                        drones_to_remove.append(drone)
+                    drones[keep] = drone
+                    keep += 1
                 continue
 
-            # Update position calculations for spatial audio (pass dt for velocity)
-            self._update_spatial_audio(drone, dt)
+            drones[keep] = drone
+            keep += 1
+
+            # LOD: distant passive drones think and move on a staggered Nth frame
+            rate = drone.update_rate
+            if (rate > 1 and drone.state in _PASSIVE_STATES and
+                    frame % rate != drone.id % rate):
+                drone.lod_dt += dt
+                continue
+            step_dt = dt + drone.lod_dt
+            drone.lod_dt = 0.0
+            drone.step_dt = step_dt
 
             # Update state machine
             camo_effective = camo_system.is_effective if camo_system else False
-            self._update_drone_state(drone, camo_effective, current_time, dt, damage_system)
+            self._update_drone_state(drone, camo_effective, current_time, step_dt, damage_system)
+            drone.update_rate = self._get_update_rate(drone)
 
             # Update ambient audio
-            self._update_ambient_audio(drone, current_time)
+            # OPTIMIZATION: Patrolling drones past audible range skip the channel
+            # work entirely; their passby finishes and restarts once back in range
+            if drone.distance <= DRONE_AUDIBLE_RANGE or drone.state not in _PASSIVE_STATES:
+                self._update_ambient_audio(drone, current_time)
+        del drones[keep:]
 
-        # Remove destroyed drones
-        for drone in drones_to_remove:
-            # Deactivate in pool if available
-            if self._drone_pool:
-                self._drone_pool.deactivate_drone(drone['id'])
-            else:
-                dc = self._get_drone_channels(drone['id'])
-                if dc:
-                    dc['ambient'].stop()
-                    dc['combat'].stop()
-            self.drones.remove(drone)
-            print(f"Drone {drone['id']} removed from game")
+        # Rebuild distance index now that all distances are current
+        self._rebuild_distance_index()
 
         # Aiming assist
         self._update_aim_assist(current_time)
 
+        # Speak at most one queued combat announcement
+        self.tick_tts(current_time)
+
         return events
 
-    def _spawn_drone(self, current_time: int) -> dict:
+    def _get_update_rate(self, drone: Drone) -> int:
+        """Pick how often a drone's state machine and ambient audio should run.
+
+        Only passive drones (patrol/searching) are throttled, so anything that
+        can threaten the player always updates every frame. Leaving a passive
+        state (e.g. reacting to player fire) takes effect on the next frame
+        regardless of the stored rate.
+
+        Args:
+            drone: Drone with current distance and state
+
+        Returns:
+            Update every Nth frame (1 = every frame)
+        """
+        if drone.state not in _PASSIVE_STATES:
+            return 1
+        distance = drone.distance
+        if distance < DRONE_ATTACK_RANGE:
+            return 1
+        if distance < AUDIO_DISTANCE_FAR:
+            return DRONE_LOD_MEDIUM_RATE
+        return DRONE_LOD_FAR_RATE
+
+    def _release_drone(self, drone: Drone):
+        """Silence a finished drone's channels and return it to the object pool.
+
+        The caller is responsible for taking the drone out of self.drones.
+
+        Args:
+            drone: Destroyed drone whose destruction sounds have finished
+        """
+        # Deactivate in pool if available
+        if self._drone_pool:
+            self._drone_pool.deactivate_drone(drone.id)
+        else:
+            dc = drone._channels
+            if dc:
+                dc['ambient'].stop()
+                dc['combat'].stop()
+        drone._channels = None
+        drone._fadeable_channels = ()
+        self._free_drone_ids.append(drone.id)
+        if DRONE_DEBUG_PRINTS:
+            print(f"Drone {drone.id} removed from game")
+
+    def _enqueue_tts(self, text: str, **speak_kwargs):
+        """Queue a combat announcement instead of speaking it immediately.
+
+        Several drones can be hit or destroyed in the same frame; speaking each
+        one synchronously stacks screen reader calls back-to-back. Queued text
+        is drained by tick_tts() with TTS_MIN_GAP_MS spacing, and a repeat of
+        the same text within TTS_COALESCE_MS is collapsed into one. Queued
+        text listed in TTS_SUPERSEDES for this text is dropped unspoken.
+
+        Args:
+            text: The text to speak
+            **speak_kwargs: Extra arguments passed through to tts.speak()
+        """
+        queue = self._tts_queue
+        superseded = self.TTS_SUPERSEDES.get(text)
+        if superseded:
+            for i in range(len(queue) - 1, -1, -1):
+                if queue[i][0] in superseded:
+                    del queue[i]
+        for queued_text, _ in queue:
+            if queued_text == text:
+                return
+        if (text == self._tts_last_text and
+                self._current_time - self._tts_last_time < self.TTS_COALESCE_MS):
+            return
+        queue.append((text, speak_kwargs))
+
+    def tick_tts(self, current_time: int):
+        """Speak the next queued announcement if the minimum gap has passed.
+
+        Args:
+            current_time: Current game time in milliseconds
+        """
+        if not self._tts_queue:
+            return
+        if current_time - self._tts_last_time < self.TTS_MIN_GAP_MS:
+            return
+        text, speak_kwargs = self._tts_queue.popleft()
+        self.tts.speak(text, **speak_kwargs)
+        self._tts_last_text = text
+        self._tts_last_time = current_time
+
+    def _spawn_drone(self, current_time: int) -> Drone:
         """Spawn a new drone.
 
         Args:
             current_time: Current game time
 
         Returns:
-            Drone dictionary or None
+            Drone instance or None
         """
         if len(self.drones) >= self.max_drones:
             return None
+        drone = self._acquire_drone()
+        if drone is None:
+            return None
 
-        spawn_angle = random.uniform(0, 360)
-        spawn_distance = random.uniform(DRONE_SPAWN_DISTANCE_MIN, DRONE_SPAWN_DISTANCE_MAX)
+        # OPTIMIZATION: Spawn rolls scale random() inline instead of paying a
+        # uniform() call frame per parameter
+        # (the bearing is drawn directly in radians - no degree conversion)
+        angle_rad = _TAU * _random()
+        spawn_distance = DRONE_SPAWN_DISTANCE_MIN + _SPAWN_DISTANCE_SPAN * _random()
 
-        angle_rad = math.radians(spawn_angle)
-        spawn_x = self._player_x + spawn_distance * math.sin(angle_rad)
-        spawn_y = self._player_y + spawn_distance * math.cos(angle_rad)
+        spawn_x = self._player_x + spawn_distance * _sin(angle_rad)
+        spawn_y = self._player_y + spawn_distance * _cos(angle_rad)
 
-        # Select personality using weighted random choice (cached lists)
-        personality_type = random.choices(
-            self._PERSONALITY_TYPES, weights=self._PERSONALITY_WEIGHTS, k=1
-        )[0]
-        personality = DRONE_PERSONALITIES[personality_type]
+        # Select personality using weighted random choice (cached table)
+        personality_type = _choice(self._PERSONALITY_TABLE)
+        (personality, speed_mult, accuracy_mult, aggression, evasion_skill,
+         inv_evasion_skill, hesitation_chance) = self._PERSONALITY_CACHE[personality_type]
 
         # Base speed with personality multiplier
-        base_speed = 5.0 + random.uniform(-1, 1)
+        base_speed = 4.0 + 2.0 * _random()  # 5.0 +/- 1
 
         # Per-drone evasion interval (randomized, modified by personality evasion_skill)
-        base_evasion_interval = random.uniform(EVASION_INTERVAL_MIN, EVASION_INTERVAL_MAX)
-        evasion_interval = base_evasion_interval / personality['evasion_skill']  # Better evasion = faster dodging
-
-        drone = {
-            'id': len(self.drones),
-            'state': 'spawning',
-            'x': spawn_x,
-            'y': spawn_y,
-            'altitude': random.uniform(30, 80),
-            'health': 100.0,
-            'distance': spawn_distance,
-            'altitude_diff': 0.0,
-            'relative_angle': 0.0,
-            'speed': base_speed * personality['speed_mult'],
-            'base_speed': base_speed,  # Store unmodified for reference
-            'climb_rate': 15.0,
-            'attack_cooldown': 0,
-            'state_start': current_time,
-            'last_sound_update': 0,
-            'patrol_target': (spawn_x, spawn_y),
-            'last_known_x': spawn_x,
-            'last_known_y': spawn_y,
-            # Velocity tracking for Doppler effect
-            'prev_x': spawn_x,
-            'prev_y': spawn_y,
-            'prev_altitude': random.uniform(30, 80),
-            'velocity': (0.0, 0.0, 0.0),  # (vx, vy, vz) in meters/second
-            # Personality system
-            'personality': personality_type,
-            'personality_data': personality,
-            'accuracy_mult': personality['accuracy_mult'],
-            'aggression': personality['aggression'],
-            'evasion_skill': personality['evasion_skill'],
-            'hesitation_chance': personality.get('hesitation_chance', HESITATION_CHANCE),
-            'evasion_interval': evasion_interval,
-            'evasion_timer': 0.0,
-            'evasion_direction': 1,  # 1 or -1, toggled during evasion
-            # Attack tracking for adaptation
-            'shots_fired': 0,
-            'hits_landed': 0,
-            'attack_frustrated': False,
-            # Coordination
-            'tactic_role': None,  # 'primary', 'support', 'flanker'
-            # Sound reaction
-            'last_sound_reaction': 0,
-            # State transition flags
-            'hesitating': False,
-            'false_start': False,
-            # Search pattern
-            'search_pattern': None,
-            'search_waypoints': [],
-            'search_waypoint_index': 0,
-            # OPTIMIZATION: Pre-computed channel IDs to avoid per-frame string allocation
-            '_channel_ids': {
-                'ambient': f"drone_{len(self.drones)}_ambient",
-                'combat': f"drone_{len(self.drones)}_combat",
-                'takeoff': f"drone_{len(self.drones)}_takeoff",
-                'passby': f"drone_{len(self.drones)}_passby",
-                'supersonic': f"drone_{len(self.drones)}_supersonic",
-                'explosion': f"drone_{len(self.drones)}_explosion",
-                'debris': f"drone_{len(self.drones)}_debris"
-            },
-            # === NEW BEHAVIOR FIELDS ===
-            # Wounded state
-            'is_wounded': False,
-            'wounded_erratic_timer': 0.0,
-            # Suppression state
-            'is_suppressed': False,
-            'suppression_end_time': 0,
-            'suppression_cooldown_end': 0,
-            'recent_damage': 0,
-            'damage_window_start': 0,
-            # Distress beacon
-            'distress_active': False,
-            'distress_start_time': 0,
-            # Coordinated assault
-            'in_coordinated_assault': False,
-            'assault_partner_id': None,
-            'assault_converge_angle': 0,
-            # Altitude flanking
-            'target_flank_altitude': None,
-            # Evasion feinting
-            'feint_pending': False,
-            'feint_timer': 0.0,
-            # Attack adaptation
-            'weapon_history': [],  # Track weapon effectiveness
-            'preferred_range': None,  # Learned optimal range
-            # Search expansion
-            'search_expand_count': 0,
-            'last_search_expand': 0
-        }
+        base_evasion_interval = EVASION_INTERVAL_MIN + _EVASION_INTERVAL_SPAN * _random()
+        evasion_interval = base_evasion_interval * inv_evasion_skill  # Better evasion = faster dodging
+
+        drone.reset(
+            drone.id, spawn_x, spawn_y, spawn_distance,
+            altitude=30.0 + 50.0 * _random(),
+            speed=base_speed * speed_mult
+        )
+        drone.state_start = current_time
+        drone.base_speed = base_speed  # Store unmodified for reference
+        drone.prev_altitude = 30.0 + 50.0 * _random()
+        # Personality system
+        drone.personality = personality_type
+        drone.personality_data = personality
+        drone.accuracy_mult = accuracy_mult
+        drone.aggression = aggression
+        drone.evasion_skill = evasion_skill
+        drone.hesitation_chance = hesitation_chance
+        drone.evasion_interval = evasion_interval
+        drone.evasion_timer = 0.0
+        drone.evasion_direction = 1  # 1 or -1, toggled during evasion
 
         self.drones.append(drone)
+        self._cached_active_drones += (drone,)
 
         # Activate in pool if available
         if self._drone_pool:
-            self._drone_pool.activate_drone(drone['id'])
+            self._drone_pool.activate_drone(drone.id)
+        # OPTIMIZATION: Resolve the channel dict once per spawn, not per use
+        drone._channels = dc = self._get_drone_channels(drone.id)
+        # Probe once which channels support fading, so the per-frame fade pass
+        # iterates wrappers directly
+        if dc:
+            drone._fadeable_channels = tuple(
+                dc[name] for name in _FADE_CHANNELS
+                if name in dc and getattr(dc[name], 'can_fade', False)
+            )
 
         # Calculate initial spatial audio for the new drone
         self._update_spatial_audio(drone)
 
         # Play spawn sound using dedicated takeoff channel (won't cut off other sounds)
-        dc = self._get_drone_channels(drone['id'])
+        dc = drone._channels
         if dc:
             sound = self.sounds.get_drone_sound('takeoffs')
             if sound:
@@ -400,7 +731,7 @@ class DroneManager:
                     position_3d=pos
                 )
                 self._set_3d_position(dc['takeoff'], drone, 'takeoff')  # Apply directional filter
-                drone['takeoff_playing'] = True
+                drone.takeoff_playing = True
 
         # Announce with personality for flavor
         personality_names = {
@@ -411,94 +742,180 @@ class DroneManager:
         }
         announcement = personality_names.get(personality_type, 'Hostile') + ' detected'
         self.tts.speak(announcement)
-        print(f"Drone {drone['id']} ({personality_type}) spawned at ({spawn_x:.1f}, {spawn_y:.1f})")
+        if DRONE_DEBUG_PRINTS:
+            print(f"Drone {drone.id} ({personality_type}) spawned at ({spawn_x:.1f}, {spawn_y:.1f})")
         return drone
 
-    def _update_spatial_audio(self, drone: dict, dt: float = 0.016):
-        """Update spatial audio positioning for a drone.
+    def _acquire_drone(self):
+        """Take a free Drone from the object pool, growing it up to max_drones.
 
-        OPTIMIZATION: Calculates pan/vol ONCE and caches in drone dict.
-        All other methods should use drone['pan'] and drone['vol'] directly.
-        Also calculates velocity for Doppler effect.
+        OPTIMIZATION: Drone objects are reset in place and reused across
+        spawns instead of being allocated per spawn. The pool slot index is
+        the drone ID, so IDs stay unique among live drones and map directly
+        to audio pool channels.
+
+        Returns:
+            Drone to reset for a new spawn, or None if every slot is in use
+        """
+        if self._free_drone_ids:
+            return self._drone_slots[self._free_drone_ids.popleft()]
+
+        drone_id = len(self._drone_slots)
+        if drone_id >= self.max_drones:
+            return None
+        drone = Drone(drone_id, 0.0, 0.0, 0.0, altitude=0.0, speed=0.0)
+        # OPTIMIZATION: Pre-computed channel IDs to avoid per-frame string allocation
+        drone._channel_ids = {
+            'ambient': f"drone_{drone_id}_ambient",
+            'combat': f"drone_{drone_id}_combat",
+            'takeoff': f"drone_{drone_id}_takeoff",
+            'passby': f"drone_{drone_id}_passby",
+            'supersonic': f"drone_{drone_id}_supersonic",
+            'weapon': f"drone_{drone_id}_weapon",
+            'explosion': f"drone_{drone_id}_explosion",
+            'debris': f"drone_{drone_id}_debris"
+        }
+        self._drone_slots.append(drone)
+        return drone
+
+    def _update_spatial_audio(self, drone: Drone, dt: float = 0.016):
+        """Update spatial audio positioning for a single drone.
+
+        Used at spawn and as a cache-miss fallback; the per-frame path is
+        _update_spatial_audio_batch().
 
         Args:
-            drone: Drone dictionary
+            drone: Drone instance
             dt: Delta time in seconds (for velocity calculation)
         """
-        pan, vol, distance, rel_angle, alt_diff = self.audio.calculate_spatial_audio(
-            source_x=drone['x'],
-            source_y=drone['y'],
-            source_altitude=drone['altitude'],
-            listener_x=self._player_x,
-            listener_y=self._player_y,
-            listener_altitude=self._player_altitude,
-            listener_facing=self._player_facing
-        )
+        self._update_spatial_audio_batch((drone,), dt)
 
-        # Apply pan smoothing to prevent jittery spatial audio during fast movement
-        # Use exponential moving average: smoothed = old * factor + new * (1 - factor)
-        if 'pan' in drone:
-            old_pan = drone['pan']
-            smoothed_pan = old_pan * self.PAN_SMOOTHING_FACTOR + pan * (1 - self.PAN_SMOOTHING_FACTOR)
-        else:
-            smoothed_pan = pan  # First frame, no smoothing needed
-
-        # Cache ALL spatial values including smoothed pan/vol for reuse this frame
-        drone['pan'] = smoothed_pan
-        drone['raw_pan'] = pan  # Store raw value for debugging
-        drone['vol'] = vol
-        drone['distance'] = distance
-        drone['relative_angle'] = rel_angle
-        drone['altitude_diff'] = alt_diff
-        drone['dt'] = dt  # Store dt for use in other methods
-
-        # Calculate velocity for Doppler effect (meters per second)
-        if dt > 0.001:  # Avoid division by zero
-            prev_x = drone['prev_x']
-            prev_y = drone['prev_y']
-            prev_alt = drone['prev_altitude']
-
-            # Calculate velocity components
-            vx = (drone['x'] - prev_x) / dt
-            vy = (drone['y'] - prev_y) / dt
-            vz = (drone['altitude'] - prev_alt) / dt / 3.28  # Convert ft to m
-
-            drone['velocity'] = (vx, vy, vz)
-
-            # Store current position for next frame
-            drone['prev_x'] = drone['x']
-            drone['prev_y'] = drone['y']
-            drone['prev_altitude'] = drone['altitude']
+    def _update_spatial_audio_batch(self, drones, dt: float = 0.016):
+        """Update spatial audio positioning for a set of drones in one pass.
 
-        # === LOGGING ===
-        alog = _get_audio_log()
-        alog.spatial(
-            source=f"Drone {drone['id']}",
-            pan=pan,
-            volume=vol,
-            distance=distance,
-            angle=rel_angle,
-            altitude_diff=alt_diff / 3.28 if alt_diff else 0  # Convert to meters for display
-        )
+        OPTIMIZATION: Calculates pan/vol ONCE per drone and caches on the
+        drone. All other methods should use drone.pan and drone.vol directly.
+        Listener position, smoothing weights, 1/dt and the bound helpers are
+        resolved once per batch instead of once per drone. Also calculates
+        velocity for Doppler effect.
+
+        OPTIMIZATION: Dirty check - when neither the listener nor the drone has
+        moved since the last update, the cached distance/angle/volume are still
+        exact, so the spatial calculation and log entry are skipped; only pan
+        smoothing continues toward the cached raw pan.
 
-    def _get_cached_spatial(self, drone: dict) -> tuple:
+        Velocity is measured over the simulated time of the drone's last step
+        (drone.step_dt), so LOD-throttled drones that move every Nth frame
+        keep a steady Doppler velocity between steps.
+
+        Dynamic pitch (distance curve + speed boost) is also resolved here,
+        once per drone, and cached as drone.pitch_params for every channel.
+
+        Args:
+            drones: Iterable of Drone instances (active drones only)
+            dt: Delta time in seconds (for velocity calculation)
+        """
+        calculate = self.audio.calculate_spatial_audio
+        listener_x = self._player_x
+        listener_y = self._player_y
+        listener_altitude = self._player_altitude
+        listener_facing = self._player_facing
+
+        listener = (listener_x, listener_y, listener_altitude, listener_facing)
+        listener_moved = listener != self._last_listener
+        self._last_listener = listener
+
+        # Exponential moving average weights: smoothed = old * factor + new * (1 - factor)
+        keep = self.PAN_SMOOTHING_FACTOR
+        blend = 1 - keep
+
+        # Velocity for Doppler effect (avoid division by zero)
+        track_velocity = dt > 0.001
+
+        log_spatial = _get_audio_log().spatial
+        log_phase = self._frame_count % AUDIO_LOG_SAMPLE_RATE
+
+        for drone in drones:
+            x = drone.x
+            y = drone.y
+            altitude = drone.altitude
+            # Displacement since last frame - shared by the dirty check and Doppler
+            dx = x - drone.prev_x
+            dy = y - drone.prev_y
+            dz = altitude - drone.prev_altitude
+            moved = dx != 0.0 or dy != 0.0 or dz != 0.0
+            # Throttled drones hold still between LOD steps but are not stationary
+            holding = drone.update_rate > 1
+
+            # Nothing moved since last frame - cached spatial values are still valid
+            if track_velocity and not moved and not listener_moved and drone.pan is not None:
+                drone.pan = drone.pan * keep + drone.raw_pan * blend
+                if not holding and drone.velocity is not _ZERO_VELOCITY:
+                    drone.velocity = _ZERO_VELOCITY
+                    drone.pitch_params = _pitch_params(drone.distance, _ZERO_VELOCITY)
+                continue
+
+            pan, vol, distance, rel_angle, alt_diff = calculate(
+                x, y, altitude,
+                listener_x, listener_y, listener_altitude, listener_facing
+            )
+
+            # Apply pan smoothing to prevent jittery spatial audio during fast movement
+            if drone.pan is not None:
+                smoothed_pan = drone.pan * keep + pan * blend
+            else:
+                smoothed_pan = pan  # First frame, no smoothing needed
+
+            # Cache ALL spatial values including smoothed pan/vol for reuse this frame
+            drone.pan = smoothed_pan
+            drone.raw_pan = pan  # Store raw value for debugging
+            drone.vol = vol
+            drone.distance = distance
+            drone.relative_angle = rel_angle
+            drone.altitude_diff = alt_diff
+
+            # Calculate velocity for Doppler effect (meters per second)
+            if track_velocity and (moved or not holding):
+                inv_dt = 1.0 / drone.step_dt
+                drone.velocity = (dx * inv_dt, dy * inv_dt,
+                                  dz * inv_dt * _FT_TO_M)  # Convert ft to m
+
+                # Store current position for next frame
+                drone.prev_x = x
+                drone.prev_y = y
+                drone.prev_altitude = altitude
+
+            drone.pitch_params = _pitch_params(distance, drone.velocity)
+
+            # === LOGGING ===
+            # Sampled every AUDIO_LOG_SAMPLE_RATE frames, staggered by drone ID
+            if drone.id % AUDIO_LOG_SAMPLE_RATE == log_phase:
+                log_spatial(
+                    source=f"Drone {drone.id}",
+                    pan=pan,
+                    volume=vol,
+                    distance=distance,
+                    angle=rel_angle,
+                    altitude_diff=alt_diff * _FT_TO_M if alt_diff else 0  # Convert to meters for display
+                )
+
+    def _get_cached_spatial(self, drone: Drone) -> tuple:
         """Get cached spatial audio pan and volume for a drone.
 
         OPTIMIZATION: Returns cached values from _update_spatial_audio().
         Falls back to calculation only if cache is missing.
         """
-        if 'pan' in drone and 'vol' in drone:
-            return drone['pan'], drone['vol']
+        if drone.pan is not None:
+            return drone.pan, drone.vol
         # Fallback (should rarely happen)
         self._update_spatial_audio(drone)
-        return drone['pan'], drone['vol']
+        return drone.pan, drone.vol
 
     def _apply_pan(self, channel, pan: float, vol: float):
         """Apply stereo panning to a channel (legacy 2D method)."""
-        base_vol = BASE_VOLUMES.get('drone', 0.8)
-        self.spatial.apply_stereo_pan(channel, pan, vol, base_vol, self.audio.master_volume)
+        self.spatial.apply_stereo_pan(channel, pan, vol, _DRONE_BASE_VOLUME, self.audio.master_volume)
 
-    def _apply_dynamic_pitch(self, channel, drone: dict, distance: float):
+    def _apply_dynamic_pitch(self, channel, drone: Drone, distance: float):
         """Apply dynamic pitch variation based on distance and drone speed.
 
         Creates more immersive audio by:
@@ -508,80 +925,43 @@ class DroneManager:
 
         Args:
             channel: FMODChannelWrapper to adjust
-            drone: Drone dictionary with position and velocity data
-            distance: Distance to drone in meters
+            drone: Drone with cached pitch_params from the spatial update
+            distance: Distance to drone in meters (for logging)
         """
-        if not channel or not hasattr(channel, 'set_pitch'):
+        if not channel or not getattr(channel, 'can_set_pitch', False):
             return
 
-        try:
-            from state.constants import (
-                AUDIO_DISTANCE_CLOSE, AUDIO_DISTANCE_MEDIUM, AUDIO_DISTANCE_FAR,
-                AUDIO_PITCH_CLOSE, AUDIO_PITCH_MEDIUM, AUDIO_PITCH_FAR,
-                AUDIO_SPEED_THRESHOLD, AUDIO_SPEED_PITCH_BOOST
-            )
-        except ImportError:
-            # Use defaults if constants not defined
-            AUDIO_DISTANCE_CLOSE = 20.0
-            AUDIO_DISTANCE_MEDIUM = 40.0
-            AUDIO_DISTANCE_FAR = 60.0
-            AUDIO_PITCH_CLOSE = 1.05
-            AUDIO_PITCH_MEDIUM = 1.0
-            AUDIO_PITCH_FAR = 0.95
-            AUDIO_SPEED_THRESHOLD = 5.0
-            AUDIO_SPEED_PITCH_BOOST = 0.1
-
-        # Calculate distance-based pitch
-        if distance <= AUDIO_DISTANCE_CLOSE:
-            # Close: interpolate between close and medium pitch
-            factor = distance / AUDIO_DISTANCE_CLOSE
-            base_pitch = AUDIO_PITCH_CLOSE + factor * (AUDIO_PITCH_MEDIUM - AUDIO_PITCH_CLOSE)
-        elif distance <= AUDIO_DISTANCE_MEDIUM:
-            # Medium: interpolate between medium and far pitch
-            factor = (distance - AUDIO_DISTANCE_CLOSE) / (AUDIO_DISTANCE_MEDIUM - AUDIO_DISTANCE_CLOSE)
-            base_pitch = AUDIO_PITCH_MEDIUM + factor * (AUDIO_PITCH_FAR - AUDIO_PITCH_MEDIUM)
-        else:
-            # Far: use far pitch, slightly lower for very distant
-            if distance >= AUDIO_DISTANCE_FAR:
-                base_pitch = AUDIO_PITCH_FAR * 0.98  # Extra low for very far
-            else:
-                factor = (distance - AUDIO_DISTANCE_MEDIUM) / (AUDIO_DISTANCE_FAR - AUDIO_DISTANCE_MEDIUM)
-                base_pitch = AUDIO_PITCH_FAR + factor * (AUDIO_PITCH_FAR * 0.98 - AUDIO_PITCH_FAR)
-
-        # Add speed-based pitch boost
-        velocity = drone['velocity']
-        speed = (velocity[0]**2 + velocity[1]**2 + velocity[2]**2) ** 0.5
-
-        pitch_boost = 0.0
-        if speed > AUDIO_SPEED_THRESHOLD:
-            # Drone is moving fast - add urgency via pitch boost
-            speed_factor = min(1.0, (speed - AUDIO_SPEED_THRESHOLD) / AUDIO_SPEED_THRESHOLD)
-            pitch_boost = speed_factor * AUDIO_SPEED_PITCH_BOOST
-            base_pitch += pitch_boost
+        # OPTIMIZATION: Pitch is computed once per drone per frame in
+        # _update_spatial_audio_batch() - every channel reuses it
+        base_pitch, pitch_boost = drone.pitch_params
 
         # Apply the calculated pitch
         channel.set_pitch(base_pitch)
 
         # === LOGGING ===
+        # Sampled every AUDIO_LOG_SAMPLE_RATE frames, staggered by drone ID
+        if drone.id % AUDIO_LOG_SAMPLE_RATE != self._frame_count % AUDIO_LOG_SAMPLE_RATE:
+            return
         alog = _get_audio_log()
         alog.pitch(
-            source=f"Drone {drone['id']}",
+            source=f"Drone {drone.id}",
             distance=distance,
             base_pitch=base_pitch,
-            speed=speed,
+            speed=_hypot(*drone.velocity),
             speed_boost=pitch_boost
         )
 
-    def _get_drone_3d_position(self, drone: dict):
+    def _get_drone_3d_position(self, drone: Drone):
         """Get 3D position tuple for a drone (for passing to play()).
 
         Returns:
             Tuple of (x, y, altitude_meters) in game coordinates
         """
-        altitude_meters = drone['altitude'] / 3.28
-        return (drone['x'], drone['y'], altitude_meters)
+        altitude_meters = drone.altitude * _FT_TO_M
+        return (drone.x, drone.y, altitude_meters)
 
-    def _set_3d_position(self, channel, drone: dict, channel_type: str = 'ambient', dt: float = 0.016):
+    def _set_3d_position(self, channel, drone: Drone, channel_type: str = 'ambient', dt: float = 0.016,
+                         throttle: bool = False):
         """Set 3D position and directional filters for a channel based on drone location.
 
         Uses FMOD's native 3D spatialization plus directional filtering for
@@ -590,40 +970,82 @@ class DroneManager:
         Also updates distance-based reverb for spatial depth perception.
 
         OPTIMIZATION: Uses cached spatial values from _update_spatial_audio() instead
-        of recalculating. Values are already computed and stored in drone dict.
+        of recalculating. Values are already computed and stored on the drone.
 
         Args:
             channel: FMODChannelWrapper to position
-            drone: Drone dictionary with position data (including cached spatial values)
+            drone: Drone with position data (including cached spatial values)
             channel_type: Type of channel ('ambient', 'combat') for unique ID
             dt: Delta time in seconds for smooth interpolation
+            throttle: If True (channels re-positioned every frame), skip the
+                3D position update while the drone has moved under 0.5 m and
+                its Doppler velocity has not dropped to or risen from zero,
+                and skip the directional filter while the drone's angle,
+                altitude and distance have barely changed, the channel is not
+                fading and the last application is under FILTER_REFRESH_MS old
         """
-        if channel and hasattr(channel, 'set_3d_position'):
+        if channel and getattr(channel, 'can_position_3d', False):
             # Convert altitude from feet to meters for audio positioning
-            altitude_meters = drone['altitude'] / 3.28
+            x = drone.x
+            y = drone.y
+            altitude_meters = drone.altitude * _FT_TO_M
 
             # Get velocity for Doppler effect
-            velocity = drone['velocity']
+            velocity = drone.velocity
+
+            # OPTIMIZATION: Sub-0.5 m moves are below audible resolution, so
+            # continuously positioned channels skip the FMOD update for them
+            # (long frames always resend so a stalled frame rate catches up)
+            send_position = True
+            if throttle and dt <= self.POSITION_CATCHUP_DT:
+                last = drone._position_last.get(channel_type)
+                if (last is not None and
+                        (velocity is _ZERO_VELOCITY) == (last[3] is _ZERO_VELOCITY)):
+                    dx = x - last[0]
+                    dy = y - last[1]
+                    dz = altitude_meters - last[2]
+                    send_position = dx * dx + dy * dy + dz * dz >= self.POSITION_GATE_SQ
 
             # Set 3D position with velocity for Doppler
-            channel.set_3d_position(drone['x'], drone['y'], altitude_meters, velocity=velocity)
+            if send_position:
+                channel.set_3d_position(x, y, altitude_meters, velocity=velocity)
+                if throttle:
+                    drone._position_last[channel_type] = (x, y, altitude_meters, velocity)
 
             # OPTIMIZATION: Use cached spatial values from _update_spatial_audio()
             # instead of recalculating with calculate_directional_params()
-            relative_angle = drone['relative_angle']
-            altitude_diff = drone['altitude_diff']
-            distance = drone['distance']
+            relative_angle = drone.relative_angle
+            altitude_diff = drone.altitude_diff
+            distance = drone.distance
 
             # OPTIMIZATION: Use pre-computed channel ID to avoid per-frame string allocation
-            channel_id = drone['_channel_ids'].get(channel_type, f"drone_{drone['id']}_{channel_type}")
+            # (direct lookup - a .get() default would build the f-string on every call)
+            channel_id = drone._channel_ids[channel_type]
+
+            # OPTIMIZATION: Skip redundant filter rebinds when the drone has barely
+            # moved relative to the listener (fades rewrite the volume every frame,
+            # so fading channels always get the filter reapplied)
+            apply_filter = True
+            if throttle:
+                now = self._current_time
+                last = drone._filter_last.get(channel_type)
+                if (last is not None and not channel.is_fading() and
+                        now - last[3] < self.FILTER_REFRESH_MS and
+                        abs(relative_angle - last[0]) <= self.FILTER_ANGLE_GATE and
+                        abs(altitude_diff - last[1]) <= self.FILTER_ALTITUDE_GATE and
+                        abs(distance - last[2]) <= self.FILTER_DISTANCE_GATE):
+                    apply_filter = False
+                else:
+                    drone._filter_last[channel_type] = (relative_angle, altitude_diff, distance, now)
 
             # Apply directional filter with dt for smooth interpolation
-            self.audio.apply_directional_filter(
-                channel, relative_angle, altitude_diff, distance,
-                apply_air_absorption=True, apply_occlusion=True,
-                channel_id=channel_id,
-                dt=dt
-            )
+            if apply_filter:
+                self.audio.apply_directional_filter(
+                    channel, relative_angle, altitude_diff, distance,
+                    apply_air_absorption=True, apply_occlusion=True,
+                    channel_id=channel_id,
+                    dt=dt
+                )
 
             # Update distance-based reverb for spatial depth perception
             # Only update for ambient channels to avoid duplicate calls
@@ -639,280 +1061,326 @@ class DroneManager:
             # Apply pitch variation based on distance and speed for more immersive audio
             self._apply_dynamic_pitch(channel, drone, distance)
 
-    def _update_drone_state(self, drone: dict, camo_effective: bool,
+    def _update_drone_state(self, drone: Drone, camo_effective: bool,
                             current_time: int, dt: float, damage_system):
-        """Update drone state machine."""
-        from state.constants import (
-            DRONE_DETECT_RANGE, DRONE_LOSE_TRACK_RANGE, DRONE_REACQUIRE_RANGE,
-            DRONE_ATTACK_RANGE, DRONE_CAMO_DETECT_RANGE, DRONE_CAMO_LOSE_TRACK_RANGE,
-            DRONE_CAMO_REACQUIRE_RANGE, ALTITUDE_MAX
-        )
-
-        detect_range = DRONE_CAMO_DETECT_RANGE if camo_effective else DRONE_DETECT_RANGE
-        lose_track_range = DRONE_CAMO_LOSE_TRACK_RANGE if camo_effective else DRONE_LOSE_TRACK_RANGE
-        reacquire_range = DRONE_CAMO_REACQUIRE_RANGE if camo_effective else DRONE_REACQUIRE_RANGE
+        """Update drone state machine.
 
+        Shared wounded/suppression/distress checks run here; the per-state
+        behavior is dispatched through self._state_handlers.
+        """
         # === WOUNDED STATE CHECK ===
-        # Update wounded status based on health
-        health_percent = (drone['health'] / 100.0) * 100
-        if health_percent <= WOUNDED_HEALTH_THRESHOLD and not drone['is_wounded']:
-            drone['is_wounded'] = True
+        # Update wounded status based on health (out of 100, so already a percentage)
+        if not drone.is_wounded and drone.health <= WOUNDED_HEALTH_THRESHOLD:
+            drone.is_wounded = True
             # Modify behavior when wounded
-            drone['evasion_skill'] *= WOUNDED_EVASION_MULT
-            drone['aggression'] *= WOUNDED_AGGRESSION_MULT
+            drone.evasion_skill *= WOUNDED_EVASION_MULT
+            drone.aggression *= WOUNDED_AGGRESSION_MULT
             self.tts.speak("Drone wounded")
 
         # === SUPPRESSION STATE CHECK ===
-        if SUPPRESSION_ENABLED and drone['is_suppressed']:
-            if current_time >= drone['suppression_end_time']:
-                drone['is_suppressed'] = False
-                drone['suppression_cooldown_end'] = current_time + SUPPRESSION_COOLDOWN
+        if SUPPRESSION_ENABLED and drone.is_suppressed:
+            if current_time >= drone.suppression_end_time:
+                drone.is_suppressed = False
+                drone.suppression_cooldown_end = current_time + SUPPRESSION_COOLDOWN
             else:
                 # Can't attack while suppressed - just evade
-                if drone['state'] in ('engaging', 'winding_up', 'attacking'):
+                if drone.state in _COMBAT_STATES:
                     self._move_engaging(drone, dt)
                     return  # Skip normal state processing
 
         # === DISTRESS BEACON UPDATE ===
-        if drone['distress_active']:
-            if current_time - drone['distress_start_time'] >= DISTRESS_BEACON_DURATION:
-                drone['distress_active'] = False
-
-        state = drone['state']
-
-        if state == 'spawning':
-            # Get or calculate spawn duration (randomized per spawn)
-            if 'state_duration' not in drone:
-                drone['state_duration'] = random.randint(DRONE_SPAWN_DURATION_MIN, DRONE_SPAWN_DURATION_MAX)
-            if current_time - drone['state_start'] >= drone['state_duration']:
-                drone['state'] = 'patrol'
-                drone['patrol_target'] = self._generate_patrol_point()
-                drone['state_start'] = current_time
-                drone.pop('state_duration', None)  # Clear for next state
-
-        elif state == 'patrol':
-            reached = self._move_drone_toward(drone, drone['patrol_target'], dt)
-            if reached:
-                drone['patrol_target'] = self._generate_patrol_point()
-
-            if drone['distance'] <= detect_range:
-                drone['state'] = 'detecting'
-                drone['state_start'] = current_time
-                drone['last_known_x'] = self._player_x
-                drone['last_known_y'] = self._player_y
-                self._play_detection_sound(drone)
-
-        elif state == 'detecting':
-            drone['last_known_x'] = self._player_x
-            drone['last_known_y'] = self._player_y
-            # Get or calculate detect duration (randomized)
-            if 'state_duration' not in drone:
-                drone['state_duration'] = random.randint(DRONE_DETECT_DURATION_MIN, DRONE_DETECT_DURATION_MAX)
-                # Check for hesitation (personality-based delay)
-                if random.random() < drone['hesitation_chance']:
-                    drone['hesitating'] = True
-                    drone['state_duration'] += random.randint(300, 600)  # Additional hesitation delay
-            if current_time - drone['state_start'] >= drone['state_duration']:
-                # Check for false start (brief return to patrol)
-                if random.random() < FALSE_START_CHANCE and not drone.get('had_false_start', False):
-                    drone['state'] = 'patrol'
-                    drone['patrol_target'] = self._generate_patrol_point()
-                    drone['state_start'] = current_time
-                    drone['had_false_start'] = True  # Only one false start per detection
-                    drone.pop('state_duration', None)
-                    drone['hesitating'] = False
-                else:
-                    drone['state'] = 'engaging'
-                    drone['state_start'] = current_time
-                    drone.pop('state_duration', None)
-                    drone['hesitating'] = False
-                    drone['had_false_start'] = False  # Reset for next time
-                    self.tts.speak("Drone engaging")
-
-        elif state == 'engaging':
-            # Coordinate tactics with other drones
+        if drone.distress_active:
+            if current_time - drone.distress_start_time >= DISTRESS_BEACON_DURATION:
+                drone.distress_active = False
+
+        # OPTIMIZATION: One dict lookup instead of walking an elif chain
+        handler = self._state_handlers.get(drone.state)
+        if handler is not None:
+            handler(drone, current_time, dt, damage_system, camo_effective)
+
+    def _tick_spawning(self, drone: Drone, current_time: int, dt: float,
+                       damage_system, camo_effective: bool):
+        """Hold position until the randomized spawn duration ends, then patrol."""
+        # Get or calculate spawn duration (randomized per spawn)
+        duration = drone.state_duration
+        if duration is None:
+            drone.state_duration = duration = _randint(DRONE_SPAWN_DURATION_MIN, DRONE_SPAWN_DURATION_MAX)
+        if current_time - drone.state_start >= duration:
+            drone.state = 'patrol'
+            drone.patrol_target = self._generate_patrol_point()
+            drone.state_start = current_time
+            drone.state_duration = None  # Clear for next state
+
+    def _tick_patrol(self, drone: Drone, current_time: int, dt: float,
+                     damage_system, camo_effective: bool):
+        """Move between patrol points until the player is within detection range."""
+        detect_range = _DETECT_RANGE[camo_effective]
+
+        reached = self._move_drone_toward(drone, drone.patrol_target, dt)
+        if reached:
+            drone.patrol_target = self._generate_patrol_point()
+
+        if drone.distance <= detect_range:
+            drone.state = 'detecting'
+            drone.state_start = current_time
+            drone.last_known_x = self._player_x
+            drone.last_known_y = self._player_y
+            self._play_detection_sound(drone)
+
+    def _tick_detecting(self, drone: Drone, current_time: int, dt: float,
+                        damage_system, camo_effective: bool):
+        """Track the player for the detect duration, then engage (or false start)."""
+        drone.last_known_x = self._player_x
+        drone.last_known_y = self._player_y
+        # Get or calculate detect duration (randomized)
+        duration = drone.state_duration
+        if duration is None:
+            duration = _randint(DRONE_DETECT_DURATION_MIN, DRONE_DETECT_DURATION_MAX)
+            # Check for hesitation (personality-based delay)
+            if _random() < drone.hesitation_chance:
+                drone.hesitating = True
+                duration += _randint(300, 600)  # Additional hesitation delay
+            drone.state_duration = duration
+        if current_time - drone.state_start >= duration:
+            # Check for false start (brief return to patrol)
+            if _random() < FALSE_START_CHANCE and not drone.had_false_start:
+                drone.state = 'patrol'
+                drone.patrol_target = self._generate_patrol_point()
+                drone.state_start = current_time
+                drone.had_false_start = True  # Only one false start per detection
+                drone.state_duration = None
+                drone.hesitating = False
+            else:
+                drone.state = 'engaging'
+                drone.state_start = current_time
+                drone.state_duration = None
+                drone.hesitating = False
+                drone.had_false_start = False  # Reset for next time
+                self.tts.speak("Drone engaging")
+
+    def _tick_engaging(self, drone: Drone, current_time: int, dt: float,
+                       damage_system, camo_effective: bool):
+        """Pursue with evasion/flanking; lose track or start the attack by range."""
+        lose_track_range = _LOSE_TRACK_RANGE[camo_effective]
+
+        # Coordinate tactics with other drones (throttled, not every frame)
+        # OPTIMIZATION: Gate here so the common not-due case costs no method call
+        if current_time - drone._last_coordination >= self.COORDINATION_INTERVAL_MS:
+            drone._last_coordination = current_time
             self._coordinate_tactics(drone, current_time)
 
-            # Aggressive pursuit with evasion and flanking
-            self._move_engaging(drone, dt)
-
-            # Adjust altitude
-            self._adjust_altitude(drone, self._player_altitude, dt)
-
-            drone['last_known_x'] = self._player_x
-            drone['last_known_y'] = self._player_y
-
-            if drone['distance'] > lose_track_range:
-                drone['state'] = 'searching'
-                drone['state_start'] = current_time
-                self.tts.speak("Drone lost contact")
-                self._play_scan_sound(drone)
-            elif drone['distance'] <= DRONE_ATTACK_RANGE:
-                # Check if coordinated tactics require holding fire
-                hold_until = drone.get('hold_fire_until', 0)
-                if current_time < hold_until:
-                    return  # Wait for coordinated timing
-
-                # Transition to wind-up state for pre-attack warning
-                if DRONE_ATTACK_WINDUP_ENABLED:
-                    drone['state'] = 'winding_up'
-                    drone['state_start'] = current_time
-                    self._play_attack_windup(drone)
-                else:
-                    drone['state'] = 'attacking'
-                    drone['state_start'] = current_time
-                    self._execute_attack(drone, damage_system, current_time)
-
-        elif state == 'winding_up':
-            # Pre-attack warning state - randomized duration for unpredictability
-            if 'state_duration' not in drone:
-                drone['state_duration'] = random.randint(DRONE_ATTACK_DURATION_MIN, DRONE_ATTACK_DURATION_MAX)
-            if current_time - drone['state_start'] >= drone['state_duration']:
-                drone['state'] = 'attacking'
-                drone['state_start'] = current_time
-                drone.pop('state_duration', None)
-                # Log state change
-                alog = _get_audio_log()
-                alog.drone_state(drone['id'], 'attacking', drone['distance'], old_state='winding_up')
-                self._execute_attack(drone, damage_system, current_time)
-            # Drone still tracks player during wind-up
-            drone['last_known_x'] = self._player_x
-            drone['last_known_y'] = self._player_y
-
-        elif state == 'searching':
-            # Initialize search pattern if not set
-            if not drone.get('search_pattern'):
-                patterns = ['spiral', 'zigzag', 'wander']
-                drone['search_pattern'] = random.choice(patterns)
-                drone['search_waypoints'] = self._generate_search_waypoints(
-                    drone,
-                    drone.get('last_known_x', self._player_x),
-                    drone.get('last_known_y', self._player_y)
-                )
-                drone['search_waypoint_index'] = 0
-                drone['search_expand_count'] = 0
-                drone['last_search_expand'] = current_time
-
-            # === EXPANDING SEARCH RADIUS ===
-            if SEARCH_EXPAND_ENABLED:
-                if current_time - drone['last_search_expand'] >= SEARCH_EXPAND_INTERVAL:
-                    drone['last_search_expand'] = current_time
-                    current_mult = 1.0 + (drone['search_expand_count'] * (SEARCH_EXPAND_MULTIPLIER - 1.0))
-                    if current_mult < SEARCH_EXPAND_MAX_MULT:
-                        drone['search_expand_count'] += 1
-                        # Regenerate waypoints with expanded radius
-                        drone['search_waypoints'] = self._generate_search_waypoints(
-                            drone,
-                            drone.get('last_known_x', self._player_x),
-                            drone.get('last_known_y', self._player_y),
-                            expand_mult=1.0 + (drone['search_expand_count'] * (SEARCH_EXPAND_MULTIPLIER - 1.0))
-                        )
-                        drone['search_waypoint_index'] = 0
-
-            # Get current waypoint
-            waypoints = drone.get('search_waypoints', [])
-            wp_index = drone.get('search_waypoint_index', 0)
-
-            if waypoints and wp_index < len(waypoints):
-                target = waypoints[wp_index]
-                reached = self._move_drone_toward(drone, target, dt)
-                if reached:
-                    drone['search_waypoint_index'] = wp_index + 1
+        # Aggressive pursuit with evasion and flanking
+        self._move_engaging(drone, dt)
+
+        # Adjust altitude toward the player (or the flanking altitude if set)
+        # OPTIMIZATION: Inlined here, its only caller, so the altitude step
+        # runs in the same pass as the XY move without another method call
+        target_alt = drone.target_flank_altitude
+        if not ALTITUDE_FLANK_ENABLED or target_alt is None:
+            target_alt = self._player_altitude
+        alt_diff = drone.altitude - target_alt
+
+        # Wounded drones have erratic altitude
+        if drone.is_wounded and _random() < WOUNDED_ERRATIC_INTERVAL:
+            alt_diff += 20 * _random() - 10
+
+        if alt_diff > 5:
+            drone.altitude = max(0, drone.altitude - drone.climb_rate * dt)
+        elif alt_diff < -5:
+            drone.altitude = min(ALTITUDE_MAX, drone.altitude + drone.climb_rate * dt)
+
+        drone.last_known_x = self._player_x
+        drone.last_known_y = self._player_y
+
+        if drone.distance > lose_track_range:
+            drone.state = 'searching'
+            drone.state_start = current_time
+            self.tts.speak("Drone lost contact")
+            self._play_scan_sound(drone)
+        elif drone.distance <= DRONE_ATTACK_RANGE:
+            # Check if coordinated tactics require holding fire
+            hold_until = drone.hold_fire_until
+            if current_time < hold_until:
+                return  # Wait for coordinated timing
+
+            # Transition to wind-up state for pre-attack warning
+            if DRONE_ATTACK_WINDUP_ENABLED:
+                drone.state = 'winding_up'
+                drone.state_start = current_time
+                self._play_attack_windup(drone)
             else:
-                # Fallback to last known position if no waypoints left
-                target = (drone.get('last_known_x', self._player_x),
-                          drone.get('last_known_y', self._player_y))
-                reached = self._move_drone_toward(drone, target, dt)
-
-            # Get or calculate search timeout (randomized)
-            if 'state_duration' not in drone:
-                drone['state_duration'] = random.randint(DRONE_SEARCH_TIMEOUT_MIN, DRONE_SEARCH_TIMEOUT_MAX)
-
-            if drone['distance'] <= reacquire_range:
-                drone['state'] = 'detecting'
-                drone['state_start'] = current_time
-                drone['last_known_x'] = self._player_x
-                drone['last_known_y'] = self._player_y
-                drone.pop('state_duration', None)
-                # Clear search pattern data
-                drone['search_pattern'] = None
-                drone['search_waypoints'] = []
-                self.tts.speak("Drone reacquired")
-                self._play_detection_sound(drone)
-            elif reached or (current_time - drone['state_start'] >= drone['state_duration']):
-                drone['state'] = 'patrol'
-                drone['patrol_target'] = self._generate_patrol_point()
-                drone['state_start'] = current_time
-                drone.pop('state_duration', None)
-                # Clear search pattern data
-                drone['search_pattern'] = None
-                drone['search_waypoints'] = []
-
-        elif state == 'attacking':
-            from state.constants import DRONE_ATTACK_STATE_DURATION, DRONE_COOLDOWN_MIN, DRONE_COOLDOWN_MAX
-            # Fire shots continuously during attack state
-            self._update_attack_firing(drone, damage_system, current_time)
-            if current_time - drone['state_start'] >= DRONE_ATTACK_STATE_DURATION:
-                drone['state'] = 'cooldown'
-                drone['state_start'] = current_time
-                # Set randomized cooldown duration for this burst
-                drone['cooldown_duration'] = random.randint(DRONE_COOLDOWN_MIN, DRONE_COOLDOWN_MAX)
-                # Store player position for reassessment tracking
-                drone['last_attack_x'] = self._player_x
-                drone['last_attack_y'] = self._player_y
-                # Clear attack state
-                drone['shots_fired'] = 0
-                drone['last_shot_time'] = 0
-
-        elif state == 'cooldown':
-            cooldown_duration = drone.get('cooldown_duration', 300)
-
-            # Periodic reassessment during cooldown
-            last_peek = drone.get('last_peek_time', drone['state_start'])
-            if current_time - last_peek >= COOLDOWN_PEEK_INTERVAL:
-                drone['last_peek_time'] = current_time
-
-                # Check if should reassess (personality affects chance)
-                reassess_chance = COOLDOWN_REASSESS_CHANCE * (1 + drone['aggression'])
-                if random.random() < reassess_chance:
-                    # Track player movement since attack started
-                    last_attack_x = drone.get('last_attack_x', drone['last_known_x'])
-                    last_attack_y = drone.get('last_attack_y', drone['last_known_y'])
-                    player_moved = math.hypot(
-                        self._player_x - last_attack_x,
-                        self._player_y - last_attack_y
+                drone.state = 'attacking'
+                drone.state_start = current_time
+                self._execute_attack(drone, damage_system, current_time)
+
+    def _tick_winding_up(self, drone: Drone, current_time: int, dt: float,
+                         damage_system, camo_effective: bool):
+        """Pre-attack warning - randomized duration for unpredictability."""
+        # Pre-attack warning state - randomized duration for unpredictability
+        duration = drone.state_duration
+        if duration is None:
+            drone.state_duration = duration = _randint(DRONE_ATTACK_DURATION_MIN, DRONE_ATTACK_DURATION_MAX)
+        if current_time - drone.state_start >= duration:
+            drone.state = 'attacking'
+            drone.state_start = current_time
+            drone.state_duration = None
+            # Log state change
+            alog = _get_audio_log()
+            alog.drone_state(drone.id, 'attacking', drone.distance, old_state='winding_up')
+            self._execute_attack(drone, damage_system, current_time, drone.attack_weapon)
+        # Drone still tracks player during wind-up
+        drone.last_known_x = self._player_x
+        drone.last_known_y = self._player_y
+
+    def _tick_searching(self, drone: Drone, current_time: int, dt: float,
+                        damage_system, camo_effective: bool):
+        """Follow the search pattern until the player is reacquired or it times out."""
+        reacquire_range = _REACQUIRE_RANGE[camo_effective]
+
+        # Initialize search pattern if not set
+        if not drone.search_pattern:
+            patterns = ['spiral', 'zigzag', 'wander']
+            drone.search_pattern = _choice(patterns)
+            drone.search_waypoints = self._generate_search_waypoints(
+                drone,
+                drone.last_known_x,
+                drone.last_known_y
+            )
+            drone.search_waypoint_index = 0
+            drone.search_expand_count = 0
+            drone.last_search_expand = current_time
+
+        # === EXPANDING SEARCH RADIUS ===
+        if SEARCH_EXPAND_ENABLED:
+            if current_time - drone.last_search_expand >= SEARCH_EXPAND_INTERVAL:
+                drone.last_search_expand = current_time
+                current_mult = 1.0 + (drone.search_expand_count * (SEARCH_EXPAND_MULTIPLIER - 1.0))
+                if current_mult < SEARCH_EXPAND_MAX_MULT:
+                    drone.search_expand_count += 1
+                    # Regenerate waypoints with expanded radius
+                    drone.search_waypoints = self._generate_search_waypoints(
+                        drone,
+                        drone.last_known_x,
+                        drone.last_known_y,
+                        expand_mult=1.0 + (drone.search_expand_count * (SEARCH_EXPAND_MULTIPLIER - 1.0))
                     )
+                    drone.search_waypoint_index = 0
 
-                    # Panic response - player got very close
-                    if drone['distance'] < 10:
-                        drone['cooldown_duration'] = min(cooldown_duration, 200)  # Shorten cooldown
-                        drone['state'] = 'engaging'
-                        drone['state_start'] = current_time
-                        return  # Exit early
-
-                    # Player moved significantly - re-engage immediately
-                    elif player_moved > 10:
-                        drone['state'] = 'engaging'
-                        drone['last_known_x'] = self._player_x
-                        drone['last_known_y'] = self._player_y
-                        drone['state_start'] = current_time
-                        return  # Exit early
-
-                    # Player very far - extend cooldown and consider disengaging
-                    elif drone['distance'] > 40:
-                        drone['cooldown_duration'] = cooldown_duration + 500  # Extend cooldown
-
-            if current_time - drone['state_start'] >= cooldown_duration:
-                if drone['distance'] <= lose_track_range:
-                    drone['state'] = 'engaging'
-                    drone['last_known_x'] = self._player_x
-                    drone['last_known_y'] = self._player_y
-                else:
-                    drone['state'] = 'searching'
-                drone['state_start'] = current_time
-                drone.pop('last_peek_time', None)  # Clear peek tracking
+        # Get current waypoint
+        waypoints = drone.search_waypoints
+        wp_index = drone.search_waypoint_index
 
-    def _move_engaging(self, drone: dict, dt: float):
+        if waypoints and wp_index < len(waypoints):
+            target = waypoints[wp_index]
+            reached = self._move_drone_toward(drone, target, dt)
+            if reached:
+                drone.search_waypoint_index = wp_index + 1
+        else:
+            # Fallback to last known position if no waypoints left
+            target = (drone.last_known_x,
+                      drone.last_known_y)
+            reached = self._move_drone_toward(drone, target, dt)
+
+        # Get or calculate search timeout (randomized)
+        duration = drone.state_duration
+        if duration is None:
+            drone.state_duration = duration = _randint(DRONE_SEARCH_TIMEOUT_MIN, DRONE_SEARCH_TIMEOUT_MAX)
+
+        if drone.distance <= reacquire_range:
+            drone.state = 'detecting'
+            drone.state_start = current_time
+            drone.last_known_x = self._player_x
+            drone.last_known_y = self._player_y
+            drone.state_duration = None
+            # Clear search pattern data
+            drone.search_pattern = None
+            drone.search_waypoints = []
+            self.tts.speak("Drone reacquired")
+            self._play_detection_sound(drone)
+        elif reached or (current_time - drone.state_start >= duration):
+            drone.state = 'patrol'
+            drone.patrol_target = self._generate_patrol_point()
+            drone.state_start = current_time
+            drone.state_duration = None
+            # Clear search pattern data
+            drone.search_pattern = None
+            drone.search_waypoints = []
+
+    def _tick_attacking(self, drone: Drone, current_time: int, dt: float,
+                        damage_system, camo_effective: bool):
+        """Fire shots continuously, then drop into cooldown."""
+        # Fire shots continuously during attack state
+        self._update_attack_firing(drone, damage_system, current_time)
+        if current_time - drone.state_start >= DRONE_ATTACK_STATE_DURATION:
+            drone.state = 'cooldown'
+            drone.state_start = current_time
+            # Set randomized cooldown duration for this burst
+            drone.cooldown_duration = _randint(DRONE_COOLDOWN_MIN, DRONE_COOLDOWN_MAX)
+            # Store player position for reassessment tracking
+            drone.last_attack_x = self._player_x
+            drone.last_attack_y = self._player_y
+            # Clear attack state
+            drone.shots_fired = 0
+            drone.last_shot_time = 0
+
+    def _tick_cooldown(self, drone: Drone, current_time: int, dt: float,
+                       damage_system, camo_effective: bool):
+        """Wait out the cooldown, periodically reassessing the player."""
+        lose_track_range = _LOSE_TRACK_RANGE[camo_effective]
+
+        cooldown_duration = drone.cooldown_duration
+
+        # Periodic reassessment during cooldown
+        last_peek = drone.last_peek_time
+        if last_peek is None:
+            last_peek = drone.state_start
+        if current_time - last_peek >= COOLDOWN_PEEK_INTERVAL:
+            drone.last_peek_time = current_time
+
+            # Check if should reassess (personality affects chance)
+            reassess_chance = COOLDOWN_REASSESS_CHANCE * (1 + drone.aggression)
+            if _random() < reassess_chance:
+                # Track player movement since attack started
+                last_attack_x = drone.last_attack_x
+                last_attack_y = drone.last_attack_y
+                if last_attack_x is None:
+                    last_attack_x = drone.last_known_x
+                    last_attack_y = drone.last_known_y
+                # Only compared against a threshold - squared, no sqrt
+                moved_x = self._player_x - last_attack_x
+                moved_y = self._player_y - last_attack_y
+                player_moved_sq = moved_x * moved_x + moved_y * moved_y
+
+                # Panic response - player got very close
+                if drone.distance < 10:
+                    drone.cooldown_duration = min(cooldown_duration, 200)  # Shorten cooldown
+                    drone.state = 'engaging'
+                    drone.state_start = current_time
+                    return  # Exit early
+
+                # Player moved significantly - re-engage immediately
+                elif player_moved_sq > 100:  # Moved more than 10m
+                    drone.state = 'engaging'
+                    drone.last_known_x = self._player_x
+                    drone.last_known_y = self._player_y
+                    drone.state_start = current_time
+                    return  # Exit early
+
+                # Player very far - extend cooldown and consider disengaging
+                elif drone.distance > 40:
+                    drone.cooldown_duration = cooldown_duration + 500  # Extend cooldown
+
+        if current_time - drone.state_start >= cooldown_duration:
+            if drone.distance <= lose_track_range:
+                drone.state = 'engaging'
+                drone.last_known_x = self._player_x
+                drone.last_known_y = self._player_y
+            else:
+                drone.state = 'searching'
+            drone.state_start = current_time
+            drone.last_peek_time = None  # Clear peek tracking
+
+    def _move_engaging(self, drone: Drone, dt: float):
         """Move drone during engaging state with evasion and flanking.
 
         Implements:
@@ -924,203 +1392,214 @@ class DroneManager:
         player_y = self._player_y
 
         # Check if player is aiming at this drone
-        being_aimed_at = abs(drone['relative_angle']) < DRONE_EVASION_ANGLE
+        being_aimed_at = abs(drone.relative_angle) < DRONE_EVASION_ANGLE
 
-        # Get other engaging drones for flanking coordination
-        other_engaging = [d for d in self.drones
-                         if d['id'] != drone['id'] and d['state'] == 'engaging']
-
-        dx = player_x - drone['x']
-        dy = player_y - drone['y']
-        dist = math.hypot(dx, dy)
+        dx = player_x - drone.x
+        dy = player_y - drone.y
+        dist = _hypot(dx, dy)
 
         if dist < 0.5:
             return
 
-        if being_aimed_at and dist > 5:
+        # Unit vector toward the player, shared by the evasion and approach math
+        nx = dx / dist
+        ny = dy / dist
+
+        evading = being_aimed_at and dist > 5
+
+        # Other engaging drone for flanking coordination (skipped while evading).
+        # The nearest partner is held for PARTNER_HOLD_MS while it stays engaging
+        other = None
+        if not evading:
+            now = self._current_time
+            other = drone._flank_partner
+            if (other is None or other.state not in _ENGAGING_STATES or
+                    now >= drone._flank_partner_until):
+                other = self._find_partner(drone, _ENGAGING_STATES)
+                drone._flank_partner = other
+                drone._flank_partner_until = now + self.PARTNER_HOLD_MS
+
+        if evading:
             # Evasive maneuver - strafe at varied angle from perpendicular
             # Base perpendicular direction
-            base_perp_x = -dy / dist
-            base_perp_y = dx / dist
+            base_perp_x = -ny
+            base_perp_y = nx
 
             # Add angle variance for unpredictable movement
             # Use stored variance or generate new one on direction change
-            if 'evasion_angle_offset' not in drone:
-                drone['evasion_angle_offset'] = random.uniform(-EVASION_ANGLE_VARIANCE, EVASION_ANGLE_VARIANCE)
+            if drone.evasion_angle_offset is None:
+                self._roll_evasion_offset(drone)
 
             # Apply angle offset to perpendicular direction
-            offset_rad = math.radians(drone['evasion_angle_offset'])
-            cos_off, sin_off = math.cos(offset_rad), math.sin(offset_rad)
+            cos_off, sin_off = drone.evasion_rotation
             perp_x = base_perp_x * cos_off - base_perp_y * sin_off
             perp_y = base_perp_x * sin_off + base_perp_y * cos_off
 
             # Evasion movement - skill affects speed
-            evasion_speed = DRONE_EVASION_SPEED * drone['evasion_skill']
-            evasion_dist = evasion_speed * dt * drone['evasion_direction']
-            drone['x'] += perp_x * evasion_dist
-            drone['y'] += perp_y * evasion_dist
+            evasion_speed = DRONE_EVASION_SPEED * drone.evasion_skill
+            evasion_dist = evasion_speed * dt * drone.evasion_direction
+            drone.x += perp_x * evasion_dist
+            drone.y += perp_y * evasion_dist
 
             # Update evasion timer using per-drone interval (varies by personality)
-            drone['evasion_timer'] += dt
+            drone.evasion_timer += dt
 
             # === EVASION FEINTING ===
             # Check for feint (fake direction change before real one)
-            if FEINT_ENABLED and not drone['feint_pending']:
-                if drone['evasion_timer'] > drone['evasion_interval'] * 0.8:
+            if FEINT_ENABLED and not drone.feint_pending:
+                if drone.evasion_timer > drone.evasion_interval * 0.8:
                     # Near direction change - chance to feint
-                    if random.random() < FEINT_CHANCE:
-                        drone['feint_pending'] = True
-                        drone['feint_timer'] = 0.0
+                    if _random() < FEINT_CHANCE:
+                        drone.feint_pending = True
+                        drone.feint_timer = 0.0
                         # Fake out - reverse direction early
-                        drone['evasion_direction'] *= -1
+                        drone.evasion_direction *= -1
 
             # Handle feint double-back
-            if drone['feint_pending']:
-                drone['feint_timer'] += dt
-                if drone['feint_timer'] >= FEINT_DOUBLE_BACK_DELAY:
+            if drone.feint_pending:
+                drone.feint_timer += dt
+                if drone.feint_timer >= FEINT_DOUBLE_BACK_DELAY:
                     # Double-back - reverse again (back to original direction)
-                    drone['evasion_direction'] *= -1
-                    drone['feint_pending'] = False
-                    drone['evasion_timer'] = 0
-                    drone['evasion_angle_offset'] = random.uniform(-EVASION_ANGLE_VARIANCE, EVASION_ANGLE_VARIANCE)
-
-            elif drone['evasion_timer'] > drone['evasion_interval']:
-                drone['evasion_timer'] = 0
-                drone['evasion_direction'] *= -1
+                    drone.evasion_direction *= -1
+                    drone.feint_pending = False
+                    drone.evasion_timer = 0
+                    self._roll_evasion_offset(drone)
+
+            elif drone.evasion_timer > drone.evasion_interval:
+                drone.evasion_timer = 0
+                drone.evasion_direction *= -1
                 # New random angle offset each direction change
-                drone['evasion_angle_offset'] = random.uniform(-EVASION_ANGLE_VARIANCE, EVASION_ANGLE_VARIANCE)
+                self._roll_evasion_offset(drone)
 
             # Still approach player but slower
-            toward_dist = drone['speed'] * DRONE_ENGAGE_SPEED_MULT * 0.5 * dt
-            drone['x'] += (dx / dist) * toward_dist
-            drone['y'] += (dy / dist) * toward_dist
+            toward_dist = drone.speed * DRONE_ENGAGE_SPEED_MULT * 0.5 * dt
+            drone.x += nx * toward_dist
+            drone.y += ny * toward_dist
 
-        elif other_engaging:
+        elif other is not None:
             # Tactical flanking - maintain 90-120° separation from other drone
-            other = other_engaging[0]
-            other_angle = math.atan2(other['x'] - player_x, other['y'] - player_y)
-            my_angle = math.atan2(drone['x'] - player_x, drone['y'] - player_y)
+            other_angle = _atan2(other.x - player_x, other.y - player_y)
+            my_angle = _atan2(drone.x - player_x, drone.y - player_y)
 
-            # Current angular separation (in degrees)
-            separation = math.degrees(my_angle - other_angle) % 360
-            if separation > 180:
-                separation = 360 - separation
+            # Current angular separation (radians, 0..pi). Both angles come
+            # from atan2, so the raw difference is within +/-2pi
+            separation = abs(my_angle - other_angle)
+            if separation > _PI:
+                separation = _TAU - separation
 
             # Target separation (randomized within range, stored per drone)
-            if 'target_separation' not in drone:
-                drone['target_separation'] = random.uniform(FLANK_SEPARATION_MIN, FLANK_SEPARATION_MAX)
+            if drone.target_separation is None:
+                drone.target_separation = FLANK_SEPARATION_MIN + _FLANK_SEPARATION_SPAN * _random()
 
             # Gradual circling - move around player if not at target separation
-            if separation < FLANK_SEPARATION_MIN - 10:
+            if separation < _FLANK_TOO_CLOSE_RAD:
                 # Too close to other drone, circle away (only set once)
-                if 'circle_direction' not in drone:
-                    drone['circle_direction'] = 1 if random.random() > 0.5 else -1
-            elif separation > FLANK_SEPARATION_MAX + 10:
+                if drone.circle_direction is None:
+                    drone.circle_direction = 1 - (_getrandbits(1) << 1)
+            elif separation > _FLANK_TOO_FAR_RAD:
                 # Too far from other drone, circle toward (only toggle once)
-                if not drone.get('_circling_toward', False):
-                    drone['circle_direction'] = -drone.get('circle_direction', 1)
-                    drone['_circling_toward'] = True
+                if not drone._circling_toward:
+                    drone.circle_direction = -(drone.circle_direction or 1)
+                    drone._circling_toward = True
             else:
                 # Reset flags when in good range
-                drone['_circling_toward'] = False
+                drone._circling_toward = False
 
             # Apply gradual circling motion
-            circle_speed_rad = math.radians(FLANK_CIRCLE_SPEED) * dt
-            circle_dir = drone.get('circle_direction', 1)
+            circle_speed_rad = _FLANK_CIRCLE_SPEED_RAD * dt
+            circle_dir = drone.circle_direction or 1
             new_angle = my_angle + circle_speed_rad * circle_dir
 
             # Flank distance - store per drone to prevent jitter
-            if 'flank_distance' not in drone:
-                drone['flank_distance'] = random.uniform(FLANK_DISTANCE_MIN, FLANK_DISTANCE_MAX)
-            flank_distance = drone['flank_distance']
+            if drone.flank_distance is None:
+                drone.flank_distance = FLANK_DISTANCE_MIN + _FLANK_DISTANCE_SPAN * _random()
+            flank_distance = drone.flank_distance
 
             # === ALTITUDE-BASED FLANKING ===
             # Set altitude offset for tactical advantage (one high, one low)
             if ALTITUDE_FLANK_ENABLED:
-                if drone['target_flank_altitude'] is None:
+                if drone.target_flank_altitude is None:
                     # Determine altitude offset based on drone ID (alternates high/low)
-                    offset = random.uniform(ALTITUDE_FLANK_OFFSET_MIN, ALTITUDE_FLANK_OFFSET_MAX)
-                    if drone['id'] % 2 == 0:
-                        drone['target_flank_altitude'] = self._player_altitude + offset
+                    offset = ALTITUDE_FLANK_OFFSET_MIN + _ALTITUDE_FLANK_OFFSET_SPAN * _random()
+                    if drone.id % 2 == 0:
+                        drone.target_flank_altitude = self._player_altitude + offset
                     else:
-                        drone['target_flank_altitude'] = self._player_altitude - offset
+                        drone.target_flank_altitude = self._player_altitude - offset
 
             # Calculate new position on the circle
-            target_x = player_x + flank_distance * math.sin(new_angle)
-            target_y = player_y + flank_distance * math.cos(new_angle)
-
-            # Move toward calculated flank position
-            old_speed = drone['speed']
-            drone['speed'] *= DRONE_ENGAGE_SPEED_MULT
-            self._move_drone_toward(drone, (target_x, target_y), dt)
-            drone['speed'] = old_speed
+            target_x = player_x + flank_distance * _sin(new_angle)
+            target_y = player_y + flank_distance * _cos(new_angle)
+
+            # Move toward calculated flank position at engage speed
+            # OPTIMIZATION: Step inline on local floats instead of swapping
+            # drone.speed around a _move_drone_toward call and a target tuple
+            fdx = target_x - drone.x
+            fdy = target_y - drone.y
+            fdist = _hypot(fdx, fdy)
+            if fdist >= 0.5:
+                move_dist = drone.speed * DRONE_ENGAGE_SPEED_MULT * dt
+                if move_dist > fdist:
+                    move_dist = fdist
+                scale = move_dist / fdist
+                drone.x += fdx * scale
+                drone.y += fdy * scale
         else:
-            # Direct aggressive pursuit
-            old_speed = drone['speed']
-            drone['speed'] *= DRONE_ENGAGE_SPEED_MULT
-            self._move_drone_toward(drone, (player_x, player_y), dt)
-            drone['speed'] = old_speed
+            # Direct aggressive pursuit - reuses the unit vector computed above
+            move_dist = drone.speed * DRONE_ENGAGE_SPEED_MULT * dt
+            if move_dist > dist:
+                move_dist = dist
+            drone.x += nx * move_dist
+            drone.y += ny * move_dist
+
+    def _roll_evasion_offset(self, drone: Drone):
+        """Pick a new evasion angle offset and cache its rotation.
+
+        OPTIMIZATION: The offset only changes on a direction change, so its
+        cos/sin are computed here rather than every evading frame.
+        """
+        offset = _EVASION_ANGLE_SPAN * _random() - EVASION_ANGLE_VARIANCE
+        offset_rad = _radians(offset)
+        drone.evasion_angle_offset = offset
+        drone.evasion_rotation = (_cos(offset_rad), _sin(offset_rad))
 
-    def _move_drone_toward(self, drone: dict, target: tuple, dt: float) -> bool:
+    def _move_drone_toward(self, drone: Drone, target: tuple, dt: float) -> bool:
         """Move drone toward target position."""
         tx, ty = target
-        dx = tx - drone['x']
-        dy = ty - drone['y']
-        dist = math.hypot(dx, dy)
+        dx = tx - drone.x
+        dy = ty - drone.y
 
-        if dist < 0.5:
+        # Arrival check on the squared distance so a drone already at its
+        # waypoint returns without a square root
+        dist_sq = dx * dx + dy * dy
+        if dist_sq < 0.25:
             return True
+        dist = _sqrt(dist_sq)
 
-        move_dist = drone['speed'] * dt
+        move_dist = drone.speed * dt
         if move_dist > dist:
             move_dist = dist
 
-        drone['x'] += (dx / dist) * move_dist
-        drone['y'] += (dy / dist) * move_dist
+        # One division scales both axes
+        scale = move_dist / dist
+        drone.x += dx * scale
+        drone.y += dy * scale
         return False
 
-    def _adjust_altitude(self, drone: dict, target_alt: float, dt: float):
-        """Adjust drone altitude.
-
-        Uses target_flank_altitude for flanking drones if set.
-        """
-        from state.constants import ALTITUDE_MAX
-
-        # Use flanking altitude if set, otherwise use passed target
-        if ALTITUDE_FLANK_ENABLED and drone['target_flank_altitude'] is not None:
-            target_alt = drone['target_flank_altitude']
-
-        # Calculate difference to target
-        alt_diff = drone['altitude'] - target_alt
-        climb_rate = drone['climb_rate']
-
-        # Wounded drones have erratic altitude
-        if drone['is_wounded']:
-            # Add random altitude jitter
-            if random.random() < WOUNDED_ERRATIC_INTERVAL:
-                alt_diff += random.uniform(-10, 10)
-
-        if alt_diff > 5:
-            drone['altitude'] = max(0, drone['altitude'] - climb_rate * dt)
-        elif alt_diff < -5:
-            drone['altitude'] = min(ALTITUDE_MAX, drone['altitude'] + climb_rate * dt)
-
     def _generate_patrol_point(self) -> tuple:
         """Generate a patrol waypoint around player."""
-        patrol_distance = random.uniform(25, 35)
-        patrol_angle = random.uniform(0, 360)
-        angle_rad = math.radians(patrol_angle)
+        patrol_distance = 25 + 10 * _random()
+        sin_a, cos_a = _HEADING_RING[_getrandbits(_HEADING_RING_BITS)]
         return (
-            self._player_x + patrol_distance * math.sin(angle_rad),
-            self._player_y + patrol_distance * math.cos(angle_rad)
+            self._player_x + patrol_distance * sin_a,
+            self._player_y + patrol_distance * cos_a
         )
 
-    def _generate_search_waypoints(self, drone: dict, last_x: float, last_y: float,
+    def _generate_search_waypoints(self, drone: Drone, last_x: float, last_y: float,
                                      expand_mult: float = 1.0) -> list:
         """Generate waypoints for search pattern.
 
         Args:
-            drone: Drone dictionary (contains search_pattern)
+            drone: Drone (contains search_pattern)
             last_x: Last known player X position
             last_y: Last known player Y position
             expand_mult: Multiplier for search radius (for expanding search)
@@ -1128,7 +1607,7 @@ class DroneManager:
         Returns:
             List of (x, y) waypoints
         """
-        pattern = drone.get('search_pattern', 'wander')
+        pattern = drone.search_pattern
         waypoints = []
 
         # Apply expansion multiplier to search distances
@@ -1138,49 +1617,46 @@ class DroneManager:
 
         if pattern == 'spiral':
             # Spiral outward from last known position
-            for i in range(5):
-                angle = i * 72  # 72 degrees per step (5 steps = full circle)
+            for i, (sin_a, cos_a) in enumerate(_SPIRAL_DIRS):
                 radius = (i + 1) * spiral_exp
-                rad = math.radians(angle)
                 waypoints.append((
-                    last_x + radius * math.sin(rad),
-                    last_y + radius * math.cos(rad)
+                    last_x + radius * sin_a,
+                    last_y + radius * cos_a
                 ))
 
         elif pattern == 'zigzag':
             # Zigzag perpendicular to approach vector
             # Approach direction from drone to last known pos
-            dx = last_x - drone['x']
-            dy = last_y - drone['y']
-            dist = math.hypot(dx, dy) or 1
-
-            # Perpendicular vector
-            perp_x = -dy / dist
-            perp_y = dx / dist
+            dx = last_x - drone.x
+            dy = last_y - drone.y
+            dist = _hypot(dx, dy) or 1
 
             # Forward vector
             fwd_x = dx / dist
             fwd_y = dy / dist
 
+            # Perpendicular vector
+            perp_x = -fwd_y
+            perp_y = fwd_x
+
             # Generate zigzag pattern
             for i in range(4):
                 side = 1 if i % 2 == 0 else -1
                 forward_dist = (i + 1) * 5 * expand_mult  # 5m forward per step, scaled
                 lateral_dist = side * zigzag_width
                 waypoints.append((
-                    drone['x'] + fwd_x * forward_dist + perp_x * lateral_dist,
-                    drone['y'] + fwd_y * forward_dist + perp_y * lateral_dist
+                    drone.x + fwd_x * forward_dist + perp_x * lateral_dist,
+                    drone.y + fwd_y * forward_dist + perp_y * lateral_dist
                 ))
 
         else:  # wander
             # Random waypoints around last known position
             for _ in range(4):
-                angle = random.uniform(0, 360)
-                dist = random.uniform(wander_dist * 0.5, wander_dist)
-                rad = math.radians(angle)
+                sin_a, cos_a = _HEADING_RING[_getrandbits(_HEADING_RING_BITS)]
+                dist = wander_dist * (0.5 + 0.5 * _random())
                 waypoints.append((
-                    last_x + dist * math.sin(rad),
-                    last_y + dist * math.cos(rad)
+                    last_x + dist * sin_a,
+                    last_y + dist * cos_a
                 ))
 
         # Always end at last known position
@@ -1198,97 +1674,134 @@ class DroneManager:
             current_time: Current game time in ms
             weapon_type: Type of weapon fired (for varied reactions)
         """
-        player_facing_rad = math.radians(self._player_facing)
+        # Dodge direction - perpendicular to player's facing, same for every drone
+        player_facing_rad = _radians(self._player_facing)
+        perp_x = -_cos(player_facing_rad)
+        perp_y = _sin(player_facing_rad)
         player_x = self._player_x
         player_y = self._player_y
 
-        for drone in self.drones:
-            if drone['state'] in ('spawning', 'destroyed'):
+        # OPTIMIZATION: Camo and weapon type are the same for every drone -
+        # resolve the detection range and dodge scaling once per fire event
+        # Camo reduces sound detection range by 50%
+        sound_range = SOUND_DETECTION_RANGE
+        if self.state.camo_active and not self.state.camo_revealed:
+            sound_range = SOUND_DETECTION_RANGE * CAMO_SOUND_DETECTION_RANGE_MULT
+        dodge_scaling = _DODGE_SCALING.get(weapon_type)
+
+        # OPTIMIZATION: Only drones within the farther of the two hearing ranges
+        # can react, so bisect the distance index (closest first, destroyed
+        # drones already dropped) rather than visiting every drone
+        hearing_range = SOUND_REACTION_RANGE
+        if SOUND_DETECTION_ENABLED and sound_range > hearing_range:
+            hearing_range = sound_range
+        in_range = bisect.bisect_right(self._dist_keys, hearing_range)
+
+        for drone in self._drones_by_distance[:in_range]:
+            if drone.state in _INERT_STATES:
                 continue
 
             # === SOUND-BASED DETECTION FOR PATROL DRONES ===
-            if SOUND_DETECTION_ENABLED and drone['state'] in ('patrol', 'searching'):
-                # Camo reduces sound detection range by 50%
-                camo_effective = self.state.camo_active and not self.state.camo_revealed
-                sound_range = SOUND_DETECTION_RANGE
-                if camo_effective:
-                    sound_range = SOUND_DETECTION_RANGE * CAMO_SOUND_DETECTION_RANGE_MULT
-
-                if drone['distance'] <= sound_range:
-                    if random.random() < SOUND_DETECTION_CHANCE:
+            if SOUND_DETECTION_ENABLED and drone.state in _PASSIVE_STATES:
+                if drone.distance <= sound_range:
+                    if _random() < SOUND_DETECTION_CHANCE:
                         # Sound gave away player position!
-                        drone['state'] = 'detecting'
-                        drone['state_start'] = current_time
-                        drone['last_known_x'] = player_x
-                        drone['last_known_y'] = player_y
+                        drone.state = 'detecting'
+                        drone.state_start = current_time
+                        drone.last_known_x = player_x
+                        drone.last_known_y = player_y
                         self._play_detection_sound(drone)
                         self.tts.speak("Drone heard weapon")
                         continue
 
             # Only react if within hearing range
-            if drone['distance'] > SOUND_REACTION_RANGE:
+            if drone.distance > SOUND_REACTION_RANGE:
                 continue
 
             # Check cooldown on reactions
-            last_reaction = drone.get('last_sound_reaction', 0)
+            last_reaction = drone.last_sound_reaction
             if current_time - last_reaction < SOUND_REACTION_COOLDOWN:
                 continue
 
             # Personality affects reaction
-            personality = drone.get('personality', 'veteran')
-            aggression = drone.get('aggression', 0.5)
+            personality = drone.personality
+            aggression = drone.aggression
 
             # === WEAPON-TYPE SPECIFIC REACTIONS ===
             dodge_chance = SOUND_REACTION_DODGE_CHANCE * (1 - aggression)
-            if weapon_type == 'missiles':
-                dodge_chance = min(0.9, dodge_chance * 1.5)  # More likely to dodge missiles
-            elif weapon_type == 'emp':
-                dodge_chance = min(0.8, dodge_chance * 1.3)  # EMP is scary
+            if dodge_scaling is not None:
+                mult, cap = dodge_scaling
+                dodge_chance = min(cap, dodge_chance * mult)
 
             # Determine reaction type
-            if random.random() < dodge_chance:
+            if _random() < dodge_chance:
                 # Dodge - move perpendicular to player's facing
-                perp_x = -math.cos(player_facing_rad)
-                perp_y = math.sin(player_facing_rad)
-
                 # Random direction left or right
-                dodge_dir = random.choice([-1, 1])
+                dodge_dir = 1 - (_getrandbits(1) << 1)
                 dodge_distance = 3.0  # Meters to dodge
 
                 # Missiles cause bigger dodge
                 if weapon_type == 'missiles':
                     dodge_distance = 5.0
 
-                drone['x'] += perp_x * dodge_distance * dodge_dir
-                drone['y'] += perp_y * dodge_distance * dodge_dir
-                drone['last_sound_reaction'] = current_time
+                drone.x += perp_x * dodge_distance * dodge_dir
+                drone.y += perp_y * dodge_distance * dodge_dir
+                drone.last_sound_reaction = current_time
 
                 # Rookies might flee entirely
-                if personality == 'rookie' and random.random() < 0.3:
+                if personality == 'rookie' and _random() < 0.3:
                     # Run away
-                    dx = drone['x'] - player_x
-                    dy = drone['y'] - player_y
-                    dist = math.hypot(dx, dy) or 1
-                    drone['x'] += (dx / dist) * 5  # Move 5m away
-                    drone['y'] += (dy / dist) * 5
+                    dx = drone.x - player_x
+                    dy = drone.y - player_y
+                    scale = 5 / (_hypot(dx, dy) or 1)  # Move 5m away
+                    drone.x += dx * scale
+                    drone.y += dy * scale
             else:
                 # Advance aggressively (more likely for aggressive personalities)
-                if random.random() < aggression:
+                if _random() < aggression:
                     # Move toward player
-                    dx = player_x - drone['x']
-                    dy = player_y - drone['y']
-                    dist = math.hypot(dx, dy) or 1
+                    dx = player_x - drone.x
+                    dy = player_y - drone.y
                     advance_distance = 2.0
+                    scale = advance_distance / (_hypot(dx, dy) or 1)
+                    step_x = dx * scale
 
-                    drone['x'] += (dx / dist) * advance_distance
-                    drone['y'] += (dy / dist) * advance_distance
-                    drone['last_sound_reaction'] = current_time
+                    drone.x += step_x
+                    drone.y += dy * scale
+                    drone.last_sound_reaction = current_time
 
                     # Berserkers get extra aggressive
                     if personality == 'berserker':
-                        drone['x'] += (dx / dist) * advance_distance  # Double advance
+                        drone.x += step_x  # Double advance
+
+    def _find_partner(self, drone: Drone, states) -> Drone:
+        """Find the nearest other drone whose state is in states.
 
-    def _coordinate_tactics(self, drone: dict, current_time: int):
+        OPTIMIZATION: A single pass comparing squared distances - no list of
+        matches, no square root or trig until the pair is chosen.
+
+        Args:
+            drone: Drone looking for a partner (excluded from the result)
+            states: Container of acceptable partner states
+
+        Returns:
+            Partner Drone, or None if there is none
+        """
+        x = drone.x
+        y = drone.y
+        best = None
+        best_dist_sq = 0.0
+        for other in self.drones:
+            if other is not drone and other.state in states:
+                dx = other.x - x
+                dy = other.y - y
+                dist_sq = dx * dx + dy * dy
+                if best is None or dist_sq < best_dist_sq:
+                    best = other
+                    best_dist_sq = dist_sq
+        return best
+
+    def _coordinate_tactics(self, drone: Drone, current_time: int):
         """Assign tactical roles and coordinate multi-drone behavior.
 
         Implements:
@@ -1296,106 +1809,98 @@ class DroneManager:
         - Suppression: One drone attacks while other repositions
         - Pincer: Approach from opposite angles
 
+        Callers throttle this to once per COORDINATION_INTERVAL_MS per drone.
+
         Args:
             drone: The drone to coordinate
             current_time: Current game time in ms
         """
-        # Throttle coordination checks to every 200ms (not every frame)
-        last_coord = drone.get('_last_coordination', 0)
-        if current_time - last_coord < 200:
-            return
-        drone['_last_coordination'] = current_time
-
-        # Get other engaging/attacking drones
-        other_combat_drones = [d for d in self.drones
-                               if d['id'] != drone['id']
-                               and d['state'] in ('engaging', 'attacking', 'winding_up')]
+        # Get the other engaging/attacking drone
+        other = self._find_partner(drone, _COMBAT_STATES)
 
-        if not other_combat_drones:
+        if other is None:
             # Solo drone - acts as primary
-            drone['tactic_role'] = 'primary'
+            drone.tactic_role = 'primary'
             return
 
-        other = other_combat_drones[0]
-
         # If other drone is attacking, coordinate timing
-        if other['state'] in ('attacking', 'winding_up'):
-            other_attack_start = other.get('state_start', 0)
+        if other.state in _FIRING_STATES:
+            other_attack_start = other.state_start
             time_since_other = current_time - other_attack_start
 
             # Crossfire - try to attack within CROSSFIRE_WINDOW
             if time_since_other < CROSSFIRE_WINDOW:
-                drone['tactic_role'] = 'crossfire'
+                drone.tactic_role = 'crossfire'
                 # Ready to attack - coordinated timing
             else:
                 # Other drone has been attacking a while - be support
-                drone['tactic_role'] = 'support'
+                drone.tactic_role = 'support'
                 # Suppression role - reposition instead of immediate attack
-                if random.random() < 0.4:  # 40% chance to hold fire and reposition
-                    drone['hold_fire_until'] = current_time + 500  # Wait 500ms
+                if _random() < 0.4:  # 40% chance to hold fire and reposition
+                    drone.hold_fire_until = current_time + 500  # Wait 500ms
         else:
             # Both engaging - assign complementary roles based on aggression
-            my_aggression = drone['aggression']
-            other_aggression = other['aggression']
+            my_aggression = drone.aggression
+            other_aggression = other.aggression
 
             if my_aggression > other_aggression:
-                drone['tactic_role'] = 'primary'
-                other['tactic_role'] = 'flanker'
+                drone.tactic_role = 'primary'
+                other.tactic_role = 'flanker'
             else:
-                drone['tactic_role'] = 'flanker'
-                other['tactic_role'] = 'primary'
+                drone.tactic_role = 'flanker'
+                other.tactic_role = 'primary'
 
             # === COORDINATED ASSAULT ===
             # Check if both drones in range for synchronized attack
             if COORDINATED_ASSAULT_ENABLED:
-                if (drone['distance'] <= COORDINATED_ASSAULT_RANGE and
-                    other['distance'] <= COORDINATED_ASSAULT_RANGE):
+                if (drone.distance <= COORDINATED_ASSAULT_RANGE and
+                    other.distance <= COORDINATED_ASSAULT_RANGE):
                     # Both in range - initiate coordinated assault
-                    if not drone['in_coordinated_assault']:
-                        drone['in_coordinated_assault'] = True
-                        drone['assault_partner_id'] = other['id']
+                    if not drone.in_coordinated_assault:
+                        drone.in_coordinated_assault = True
+                        drone.assault_partner_id = other.id
                         # Set converge angles (attack from different directions)
-                        drone['assault_converge_angle'] = COORDINATED_ASSAULT_CONVERGE_ANGLE
-                        other['assault_converge_angle'] = -COORDINATED_ASSAULT_CONVERGE_ANGLE
+                        drone.assault_converge_angle = COORDINATED_ASSAULT_CONVERGE_ANGLE
+                        other.assault_converge_angle = -COORDINATED_ASSAULT_CONVERGE_ANGLE
                         # Sync attack timing
-                        drone['hold_fire_until'] = current_time + COORDINATED_ASSAULT_SYNC_WINDOW
-                        other['hold_fire_until'] = current_time + COORDINATED_ASSAULT_SYNC_WINDOW
+                        drone.hold_fire_until = current_time + COORDINATED_ASSAULT_SYNC_WINDOW
+                        other.hold_fire_until = current_time + COORDINATED_ASSAULT_SYNC_WINDOW
 
                         # === COORDINATION AUDIO ===
                         # Play transmission sound to indicate drones coordinating
                         self._play_coordination_audio(drone)
 
-    def _play_coordination_audio(self, drone: dict):
+    def _play_coordination_audio(self, drone: Drone):
         """Play transmission sound when drones coordinate tactics."""
         sound = self.sounds.get_drone_sound('transmissions')
         if sound:
-            dc = self._get_drone_channels(drone['id'])
+            dc = drone._channels
             if dc:
                 pos = self._get_drone_3d_position(drone)
                 dc['combat'].play(sound, position_3d=pos)
                 self._set_3d_position(dc['combat'], drone, 'combat')
 
-    def _play_detection_sound(self, drone: dict):
+    def _play_detection_sound(self, drone: Drone):
         """Play drone detection beacon sound with 3D positioning."""
         sound = self.sounds.get_drone_sound('beacons')
         if sound:
-            dc = self._get_drone_channels(drone['id'])
+            dc = drone._channels
             if dc:
                 pos = self._get_drone_3d_position(drone)
                 dc['combat'].play(sound, position_3d=pos)
                 self._set_3d_position(dc['combat'], drone, 'combat')  # Apply directional filter
 
-    def _play_scan_sound(self, drone: dict):
+    def _play_scan_sound(self, drone: Drone):
         """Play drone scanning sound with 3D positioning."""
         sound = self.sounds.get_drone_sound('scans')
         if sound:
-            dc = self._get_drone_channels(drone['id'])
+            dc = drone._channels
             if dc:
                 pos = self._get_drone_3d_position(drone)
                 dc['combat'].play(sound, position_3d=pos)
                 self._set_3d_position(dc['combat'], drone, 'combat')  # Apply directional filter
 
-    def _play_attack_windup(self, drone: dict):
+    def _play_attack_windup(self, drone: Drone):
         """Play pre-attack warning sound with 3D positioning.
 
         This gives players a ~200ms audio cue before the attack starts,
@@ -1409,19 +1914,19 @@ class DroneManager:
         # === LOGGING ===
         alog = _get_audio_log()
         alog.attack_warning(
-            drone_id=drone['id'],
+            drone_id=drone.id,
             windup_ms=DRONE_ATTACK_WINDUP_MS,
-            distance=drone['distance']
+            distance=drone.distance
         )
-        alog.drone_state(drone['id'], 'winding_up', drone['distance'], old_state='engaging')
+        alog.drone_state(drone.id, 'winding_up', drone.distance, old_state='engaging')
 
         # Pre-select weapon for this attack (stored for execution phase)
         weapon_type = self._select_weapon(drone)
-        drone['attack_weapon'] = weapon_type
+        drone.attack_weapon = weapon_type
 
         # === WEAPON-SPECIFIC WIND-UP SOUNDS ===
         # Try to use weapon-specific sounds, fall back to beacons
-        dc = self._get_drone_channels(drone['id'])
+        dc = drone._channels
         if not dc:
             return
 
@@ -1430,45 +1935,46 @@ class DroneManager:
         # Try weapon-specific sound first (weapon types are direct categories)
         weapon_sound = self.sounds.get_drone_sound(weapon_type)
         if weapon_sound:
-            dc['combat'].play(weapon_sound, position_3d=pos, velocity=drone['velocity'])
+            dc['combat'].play(weapon_sound, position_3d=pos, velocity=drone.velocity)
             self._set_3d_position(dc['combat'], drone, 'combat')
-            alog.drone_audio(drone['id'], f'windup_{weapon_type}', 'play')
+            alog.drone_audio(drone.id, f'windup_{weapon_type}', 'play')
         else:
             # Fall back to beacon sounds with pitch variation by weapon
             sound = self.sounds.get_drone_sound('beacons')
             if sound:
-                dc['combat'].play(sound, position_3d=pos, velocity=drone['velocity'])
+                dc['combat'].play(sound, position_3d=pos, velocity=drone.velocity)
                 self._set_3d_position(dc['combat'], drone, 'combat')
-                alog.drone_audio(drone['id'], 'windup_beacon', 'play')
+                alog.drone_audio(drone.id, 'windup_beacon', 'play')
 
-    def _update_ambient_audio(self, drone: dict, current_time: int):
+    def _update_ambient_audio(self, drone: Drone, current_time: int):
         """Update drone ambient/movement audio with 3D positioning.
 
         Sound volume is controlled by FMOD 3D distance attenuation.
         Sounds loop continuously while drone is active.
+
+        OPTIMIZATION: The 3D position tuple is only built when a sound starts;
+        continuing sounds are re-positioned from the drone directly by
+        _set_3d_position().
         """
         # Allow ambient audio during all active drone states
         # (not during spawning, destroyed, or searching when drone lost player)
-        if drone['state'] not in ('patrol', 'detecting', 'engaging', 'attacking', 'cooldown'):
+        if drone.state not in _AMBIENT_STATES:
             return
 
-        dc = self._get_drone_channels(drone['id'])
+        dc = drone._channels
         if not dc:
             return
 
         # Determine which sound type is needed based on drone behavior
         # Supersonic for aggressive states (engaging, attacking), passby for patrol
-        need_supersonic = (drone['state'] in ('engaging', 'attacking'))
+        need_supersonic = drone.state in _SUPERSONIC_STATES
 
-        # Get drone position for 3D audio
-        pos = self._get_drone_3d_position(drone)
-
-        # Get dt from drone (stored during spatial audio update)
-        dt = drone['dt']
+        # Frame delta is shared by all drones (stored once in update())
+        dt = self._frame_dt
 
         # Update takeoff channel position if still playing
         if dc['takeoff'].get_busy():
-            self._set_3d_position(dc['takeoff'], drone, 'takeoff', dt=dt)
+            self._set_3d_position(dc['takeoff'], drone, 'takeoff', dt=dt, throttle=True)
 
         # Handle passby channel (patrol sounds) - separate channel, won't cut off others
         if not need_supersonic:
@@ -1485,10 +1991,10 @@ class DroneManager:
                         fade_in_ms=self.PASSBY_FADE_IN_MS,
                         loops=0,
                         mono_downmix=True,
-                        position_3d=pos
+                        position_3d=self._get_drone_3d_position(drone)
                     )
             # Update 3D position
-            self._set_3d_position(dc['passby'], drone, 'passby', dt=dt)
+            self._set_3d_position(dc['passby'], drone, 'passby', dt=dt, throttle=True)
         else:
             # Need supersonic sound - stop passby if playing, start/continue supersonic
             if dc['passby'].get_busy():
@@ -1503,145 +2009,158 @@ class DroneManager:
                         fade_in_ms=self.SUPERSONIC_FADE_IN_MS,
                         loops=0,
                         mono_downmix=True,
-                        position_3d=pos
+                        position_3d=self._get_drone_3d_position(drone)
                     )
             # Update 3D position
-            self._set_3d_position(dc['supersonic'], drone, 'supersonic', dt=dt)
+            self._set_3d_position(dc['supersonic'], drone, 'supersonic', dt=dt, throttle=True)
 
-    def _execute_attack(self, drone: dict, damage_system, current_time: int):
-        """Initialize drone attack on player - sets up rapid fire state."""
+    def _execute_attack(self, drone: Drone, damage_system, current_time: int,
+                        weapon_type: str = None):
+        """Initialize drone attack on player - sets up rapid fire state.
+
+        Args:
+            drone: The attacking drone
+            damage_system: Damage system for player hits
+            current_time: Current game time in ms
+            weapon_type: Weapon pre-selected during wind-up, or None to select now
+        """
         if self.state.game_over:
             return
 
-        weapon_type = self._select_weapon(drone)
+        # OPTIMIZATION: The wind-up already drew this burst's weapon (and
+        # announced it), so only select here when attacking without a wind-up
         if weapon_type is None:
-            return
+            weapon_type = self._select_weapon(drone)
+            if weapon_type is None:
+                return
 
-        weapon = DRONE_WEAPONS.get(weapon_type, DRONE_WEAPONS['pulse_cannon'])
+        weapon = DRONE_WEAPONS[weapon_type]
 
         # Randomized shot count within weapon's range
-        shots_min = weapon.get('shots_min', 4)
-        shots_max = weapon.get('shots_max', 6)
-        num_shots = random.randint(shots_min, shots_max)
+        shots_min = weapon['shots_min']
+        shots_max = weapon['shots_max']
+        num_shots = _randint(shots_min, shots_max)
 
         # Initialize attack state for rapid fire
-        drone['attack_weapon'] = weapon_type
-        drone['shots_to_fire'] = num_shots
-        drone['shots_fired'] = 0
-        drone['last_shot_time'] = 0
-        drone['hits_this_burst'] = 0
+        drone.attack_weapon = weapon_type
+        drone.shots_to_fire = num_shots
+        drone.shots_fired = 0
+        drone.last_shot_time = 0
+        drone.hits_this_burst = 0
 
         # Store interval range for staggered timing (each shot gets random interval)
-        drone['interval_min'] = weapon.get('interval_min', 80)
-        drone['interval_max'] = weapon.get('interval_max', 120)
-        drone['next_shot_interval'] = random.randint(drone['interval_min'], drone['interval_max'])
+        interval_min = weapon['interval_min']
+        interval_max = weapon['interval_max']
+        drone.interval_min = interval_min
+        drone.interval_max = interval_max
+        # OPTIMIZATION: Pre-draw every interval of the burst (plus the lead-in)
+        # with one random() call each instead of a randint() call chain per shot
+        span = interval_max - interval_min + 1
+        drone.shot_intervals = [interval_min + int(_random() * span) for _ in range(num_shots + 1)]
+        drone.next_shot_interval = drone.shot_intervals[0]
 
         # Calculate hit chance once for this burst (personality affects accuracy)
-        accuracy_mult = drone['accuracy_mult']
-        distance_factor = drone['distance'] / weapon['range']
+        accuracy_mult = drone.accuracy_mult
+        distance_factor = drone.distance / weapon['range']
         hit_chance = (weapon['accuracy'] * accuracy_mult) - (distance_factor * 0.2)
-        altitude_diff = abs(drone['altitude_diff'])
+        altitude_diff = abs(drone.altitude_diff)
         if altitude_diff > 20:
             altitude_penalty = min(0.3, altitude_diff / 150)
             hit_chance -= altitude_penalty
-        drone['hit_chance'] = max(0.2, hit_chance)
+        drone.hit_chance = max(0.2, hit_chance)
         # Track hits for adaptation
-        drone['hits_this_burst'] = 0
+        drone.hits_this_burst = 0
 
-    def _update_attack_firing(self, drone: dict, damage_system, current_time: int):
+    def _update_attack_firing(self, drone: Drone, damage_system, current_time: int):
         """Fire individual shots with sounds during attack state - staggered timing."""
         if self.state.game_over:
             return
 
-        shots_to_fire = drone.get('shots_to_fire', 0)
-        shots_fired = drone.get('shots_fired', 0)
-        last_shot_time = drone.get('last_shot_time', 0)
-        next_interval = drone.get('next_shot_interval', 80)
-
-        # Check if we have more shots to fire and enough time has passed
-        if shots_fired < shots_to_fire:
-            if current_time - last_shot_time >= next_interval:
-                # Fire a shot
-                weapon_type = drone.get('attack_weapon', 'pulse_cannon')
-                weapon = DRONE_WEAPONS.get(weapon_type, DRONE_WEAPONS['pulse_cannon'])
-
-                # Play weapon sound with 3D positioning at drone's exact location
-                dc = self._get_drone_channels(drone['id'])
-                weapon_sound = self.sounds.get_drone_sound(weapon_type)
-                if weapon_sound and dc:
-                    pos = self._get_drone_3d_position(drone)
-                    velocity = drone['velocity']
-                    # Play with position and velocity for proper 3D + Doppler
-                    dc['combat'].play(weapon_sound, position_3d=pos, velocity=velocity)
-                    # Apply directional filters (lowpass for behind, etc.)
-                    self._set_3d_position(dc['combat'], drone, 'combat')
-
-                # Check if this shot hits
-                hit_chance = drone.get('hit_chance', 0.5)
-                if random.random() < hit_chance:
-                    damage_system.apply_damage(weapon['damage'], current_time)
-                    drone['hits_this_burst'] += 1
-
-                    # Play hit sound
-                    hit_sound = self.sounds.get_drone_sound('projectile_hit')
-                    if hit_sound:
-                        channel = self.audio.get_channel('player_damage')
-                        channel.set_volume(BASE_VOLUMES.get('drone', 0.8) * self.audio.master_volume)
-                        channel.play(hit_sound)
-
-                drone['shots_fired'] = shots_fired + 1
-                drone['last_shot_time'] = current_time
-
-                # Generate new random interval for next shot (staggered timing)
-                interval_min = drone.get('interval_min', 80)
-                interval_max = drone.get('interval_max', 120)
-                drone['next_shot_interval'] = random.randint(interval_min, interval_max)
-
-                # Attack adaptation - check if drone should break off early
-                new_shots_fired = drone['shots_fired']
-                if new_shots_fired >= ATTACK_MIN_SHOTS_BEFORE_ADAPT:
-                    hits = drone.get('hits_this_burst', 0)
-                    hit_rate = hits / new_shots_fired if new_shots_fired > 0 else 0
-
-                    # If hit rate is too low, drone gets frustrated
-                    if hit_rate < ATTACK_FRUSTRATION_THRESHOLD:
-                        drone['attack_frustrated'] = True
-                        # Chance to break off attack early
-                        if random.random() < ATTACK_BREAK_OFF_CHANCE:
-                            # Force end of burst - return to cooldown early
-                            drone['shots_to_fire'] = new_shots_fired  # Stop firing more
-                            self._log_attack_results(drone, weapon_type)
-                            return
-
-                # Log the burst results after all shots fired
-                if drone['shots_fired'] >= shots_to_fire:
+        # Burst finished, or the next staggered shot is not due yet
+        shots_to_fire = drone.shots_to_fire
+        shots_fired = drone.shots_fired
+        if (shots_fired >= shots_to_fire
+                or current_time - drone.last_shot_time < drone.next_shot_interval):
+            return
+
+        # Fire a shot
+        mv = self.audio.master_volume
+        weapon_type = drone.attack_weapon
+        weapon = DRONE_WEAPONS[weapon_type]
+
+        # Play weapon sound with 3D positioning at drone's exact location
+        dc = drone._channels
+        weapon_sound = self.sounds.get_drone_sound(weapon_type)
+        if weapon_sound and dc:
+            pos = self._get_drone_3d_position(drone)
+            velocity = drone.velocity
+            # Play with position and velocity for proper 3D + Doppler
+            dc['combat'].play(weapon_sound, position_3d=pos, velocity=velocity)
+            # Apply directional filters (lowpass for behind, etc.)
+            self._set_3d_position(dc['combat'], drone, 'combat')
+
+        # Check if this shot hits
+        hits = drone.hits_this_burst
+        if _random() < drone.hit_chance:
+            damage_system.apply_damage(weapon['damage'], current_time)
+            hits += 1
+            drone.hits_this_burst = hits
+
+            # Play hit sound
+            hit_sound = self.sounds.get_drone_sound('projectile_hit')
+            if hit_sound:
+                channel = self.audio.get_channel('player_damage')
+                channel.play(hit_sound, volume=_DRONE_BASE_VOLUME * mv)
+
+        # Burst counters stay in locals from here on; only the stores touch the drone
+        shots_fired += 1
+        drone.shots_fired = shots_fired
+        drone.last_shot_time = current_time
+
+        # Next pre-drawn random interval (staggered timing)
+        drone.next_shot_interval = drone.shot_intervals[shots_fired]
+
+        # Attack adaptation - check if drone should break off early
+        if shots_fired >= ATTACK_MIN_SHOTS_BEFORE_ADAPT:
+            hit_rate = hits / shots_fired
+
+            # If hit rate is too low, drone gets frustrated
+            if hit_rate < ATTACK_FRUSTRATION_THRESHOLD:
+                drone.attack_frustrated = True
+                # Chance to break off attack early
+                if _random() < ATTACK_BREAK_OFF_CHANCE:
+                    # Force end of burst - return to cooldown early
+                    drone.shots_to_fire = shots_fired  # Stop firing more
                     self._log_attack_results(drone, weapon_type)
+                    return
+
+        # Log the burst results after all shots fired
+        if shots_fired >= shots_to_fire:
+            self._log_attack_results(drone, weapon_type)
 
-    def _log_attack_results(self, drone: dict, weapon_type: str):
+    def _log_attack_results(self, drone: Drone, weapon_type: str):
         """Log attack results after burst completes and apply attack adaptation."""
         if self.state.game_over:
             return
 
-        weapon = DRONE_WEAPONS.get(weapon_type, DRONE_WEAPONS['pulse_cannon'])
-        shots_fired = drone.get('shots_fired', 0)
-        hits = drone.get('hits_this_burst', 0)
+        weapon = DRONE_WEAPONS[weapon_type]
+        shots_fired = drone.shots_fired
+        hits = drone.hits_this_burst
         total_damage = hits * weapon['damage']
-        distance_at_attack = drone['distance']
+        distance_at_attack = drone.distance
 
-        if hits > 0:
-            print(f"Drone {drone['id']} ({weapon['name']}) {hits}/{shots_fired} hits for {total_damage} damage")
-        else:
-            print(f"Drone {drone['id']} ({weapon['name']}) missed")
+        if DRONE_DEBUG_PRINTS:
+            if hits > 0:
+                print(f"Drone {drone.id} ({weapon['name']}) {hits}/{shots_fired} hits for {total_damage} damage")
+            else:
+                print(f"Drone {drone.id} ({weapon['name']}) missed")
 
         # === CONTEXT-AWARE ATTACK ADAPTATION ===
         if ATTACK_ADAPTATION_ENABLED:
             hit_rate = hits / shots_fired if shots_fired > 0 else 0
 
             # Track weapon effectiveness
-            if 'weapon_history' not in drone:
-                drone['weapon_history'] = []
-
-            drone['weapon_history'].append({
+            drone.weapon_history.append({
                 'weapon': weapon_type,
                 'hit_rate': hit_rate,
                 'distance': distance_at_attack,
@@ -1650,65 +2169,63 @@ class DroneManager:
             })
 
             # Keep only last 5 attacks for learning
-            if len(drone['weapon_history']) > 5:
-                drone['weapon_history'] = drone['weapon_history'][-5:]
+            if len(drone.weapon_history) > 5:
+                drone.weapon_history = drone.weapon_history[-5:]
 
             # Learn optimal range from successful attacks
-            successful_attacks = [a for a in drone['weapon_history'] if a['hit_rate'] >= 0.3]
+            successful_attacks = [a for a in drone.weapon_history if a['hit_rate'] >= 0.3]
             if successful_attacks:
                 avg_good_range = sum(a['distance'] for a in successful_attacks) / len(successful_attacks)
-                drone['preferred_range'] = avg_good_range
+                drone.preferred_range = avg_good_range
 
             # If hit rate is very low, consider switching weapons next time
             if hit_rate < ATTACK_WEAPON_SWITCH_THRESHOLD:
                 # Mark that this weapon didn't work well at this range
-                drone['_avoid_weapon'] = weapon_type
-                drone['_avoid_distance'] = distance_at_attack
+                drone._avoid_weapon = weapon_type
+                drone._avoid_distance = distance_at_attack
 
             # If hit rate is good, reinforce this weapon/range combo
             if hit_rate >= 0.4:
-                drone['_effective_weapon'] = weapon_type
-                drone['_effective_distance'] = distance_at_attack
+                drone._effective_weapon = weapon_type
+                drone._effective_distance = distance_at_attack
 
         # Reset burst tracking
-        drone['hits_this_burst'] = 0
+        drone.hits_this_burst = 0
 
-    def _select_weapon(self, drone: dict) -> str:
+    def _select_weapon(self, drone: Drone) -> str:
         """Select weapon based on distance AND personality.
 
         Different personalities prefer different weapons and ranges.
         Also considers attack adaptation (learned optimal range).
         """
-        distance = drone['distance']
-        personality = drone['personality']
+        distance = drone.distance
+        personality = drone.personality
 
         # Check if attack adaptation has set a preferred range
-        if ATTACK_ADAPTATION_ENABLED and drone.get('preferred_range'):
-            pref_range = drone['preferred_range']
+        if ATTACK_ADAPTATION_ENABLED and drone.preferred_range:
+            pref_range = drone.preferred_range
             # Adjust distance preference slightly toward learned optimal
             distance = distance * 0.7 + pref_range * 0.3
 
-        # Get personality-specific weapon preferences
-        prefs = PERSONALITY_WEAPON_PREFS.get(personality, PERSONALITY_WEAPON_PREFS['veteran'])
-
-        # Find weapons valid for current distance
-        valid_weapons = []
-        for weapon, (min_range, max_range) in prefs.items():
-            if min_range <= distance <= max_range:
-                valid_weapons.append(weapon)
+        # Find weapons valid for current distance from the personality's
+        # pre-flattened (weapon, min_range, max_range) preferences
+        valid_weapons = [
+            weapon for weapon, min_range, max_range in _WEAPON_RANGES[personality]
+            if min_range <= distance <= max_range
+        ]
 
         if valid_weapons:
             # Wounded drones prefer faster weapons (panic)
-            if drone['is_wounded'] and 'pulse_cannon' in valid_weapons:
+            if drone.is_wounded and 'pulse_cannon' in valid_weapons:
                 return 'pulse_cannon'
 
             # Personality-based selection from valid weapons
             if personality == 'berserker':
                 # Prefer high damage weapons
                 if 'rail_gun' in valid_weapons:
-                    return 'rail_gun' if random.random() < 0.6 else random.choice(valid_weapons)
+                    return 'rail_gun' if _random() < 0.6 else _choice(valid_weapons)
                 if 'plasma_launcher' in valid_weapons:
-                    return 'plasma_launcher' if random.random() < 0.7 else random.choice(valid_weapons)
+                    return 'plasma_launcher' if _random() < 0.7 else _choice(valid_weapons)
             elif personality == 'ace':
                 # Optimal selection based on exact range
                 if distance <= 12 and 'pulse_cannon' in valid_weapons:
@@ -1720,55 +2237,52 @@ class DroneManager:
             elif personality == 'rookie':
                 # Prefer close-range, safer weapons
                 if 'pulse_cannon' in valid_weapons:
-                    return 'pulse_cannon' if random.random() < 0.7 else random.choice(valid_weapons)
+                    return 'pulse_cannon' if _random() < 0.7 else _choice(valid_weapons)
 
-            return random.choice(valid_weapons)
+            return _choice(valid_weapons)
 
-        # Fallback: use old logic if no valid weapons found
-        if distance <= 15:
-            return random.choice(['pulse_cannon', 'pulse_cannon', 'plasma_launcher'])
-        elif distance <= 25:
-            return random.choice(['pulse_cannon', 'plasma_launcher', 'plasma_launcher'])
-        elif distance <= 35:
-            return random.choice(['plasma_launcher', 'plasma_launcher', 'rail_gun'])
-        elif distance <= 45:
-            return random.choice(['rail_gun', 'rail_gun', 'plasma_launcher'])
-
-        return None
+        # Fallback: distance buckets if no valid weapons found
+        # (bisect_left so a distance equal to a limit stays in that bucket)
+        bucket = bisect.bisect_left(_WEAPON_BUCKET_LIMITS, distance)
+        if bucket == len(_WEAPON_BUCKETS):
+            return None
+        chance, likely, other = _WEAPON_BUCKETS[bucket]
+        return likely if _random() < chance else other
 
     def _update_aim_assist(self, current_time: int):
-        """Update aiming assist beep with two tiers: direct lock and approximate facing."""
-        # Use cached active drones list
-        active_drones = self._get_active_drones_cached()
-        if not active_drones:
-            return
+        """Update aiming assist beep with two tiers: direct lock and approximate facing.
 
-        for drone in active_drones:
-            if drone['distance'] > 40:
-                continue
+        OPTIMIZATION: Only drones within assist range are visited, taken from
+        the per-frame distance index rather than filtering the whole active
+        list, and |relative_angle| is computed once per drone inside a single
+        C-level min(map(...)) chain.
+        """
+        in_range = bisect.bisect_right(self._dist_keys, AIM_ASSIST_RANGE)
+        if not in_range:
+            return
 
-            # Check for direct target lock (very tight angle)
-            if abs(drone['relative_angle']) <= TARGET_LOCK_ANGLE:
-                if current_time - self.state.last_target_lock_beep >= TARGET_LOCK_COOLDOWN:
+        # Tightest aim over every in-range drone (argmin of |relative_angle|),
+        # so a locked drone wins even when a closer one is only roughly faced
+        best_angle = min(map(abs, map(_angle_key, self._drones_by_distance[:in_range])))
+
+        # Check for direct target lock (very tight angle)
+        if best_angle <= TARGET_LOCK_ANGLE:
+            if current_time - self.state.last_target_lock_beep >= TARGET_LOCK_COOLDOWN:
+                channel = self.audio.get_channel('player_damage')
+                channel.play('target_lock', volume=0.5 * self.audio.master_volume)
+                self.state.last_target_lock_beep = current_time
+                self.state.last_aim_assist_beep = current_time  # Also reset aim assist
+
+        # Check for approximate facing (wider angle)
+        elif best_angle <= 45:
+            if current_time - self.state.last_aim_assist_beep >= AIM_ASSIST_COOLDOWN:
+                sound = self.sounds.get_drone_sound('beacons', 0)
+                if sound:
                     channel = self.audio.get_channel('player_damage')
-                    channel.set_volume(0.5 * self.audio.master_volume)
-                    channel.play('target_lock')
-                    self.state.last_target_lock_beep = current_time
-                    self.state.last_aim_assist_beep = current_time  # Also reset aim assist
-                break
-
-            # Check for approximate facing (wider angle)
-            elif abs(drone['relative_angle']) <= 45:
-                if current_time - self.state.last_aim_assist_beep >= AIM_ASSIST_COOLDOWN:
-                    sound = self.sounds.get_drone_sound('beacons', 0)
-                    if sound:
-                        channel = self.audio.get_channel('player_damage')
-                        channel.set_volume(0.3 * self.audio.master_volume)
-                        channel.play(sound)
-                    self.state.last_aim_assist_beep = current_time
-                break
-
-    def damage_drone(self, drone: dict, damage: float) -> bool:
+                    channel.play(sound, volume=0.3 * self.audio.master_volume)
+                self.state.last_aim_assist_beep = current_time
+
+    def damage_drone(self, drone: Drone, damage: float) -> bool:
         """Apply damage to a drone with hit confirmation audio feedback.
 
         Hit confirmation varies based on damage dealt and remaining health:
@@ -1778,230 +2292,258 @@ class DroneManager:
         - Kill: Distinct destruction confirmation
 
         Args:
-            drone: Drone dict
+            drone: Drone instance
             damage: Damage amount
 
         Returns:
             True if drone was destroyed
         """
-        old_health = drone['health']
-        drone['health'] -= damage
+        old_health = drone.health
+        drone.health -= damage
+        mv = self.audio.master_volume
 
         # Determine hit confirmation tier based on damage and remaining health
-        health_percent = max(0, drone['health'] / 100.0)
-        is_kill = drone['health'] <= 0
-
-        # Get hit confirmation constants
-        try:
-            from state.constants import HIT_CONFIRM_DAMAGE_THRESHOLDS, HIT_CONFIRM_KILL_SOUND
-        except ImportError:
-            HIT_CONFIRM_DAMAGE_THRESHOLDS = [25, 50, 75]
-            HIT_CONFIRM_KILL_SOUND = True
+        is_kill = drone.health <= 0
 
         # Select sound and volume based on hit tier
         channel = self.audio.get_channel('player_damage')
         alog = _get_audio_log()
 
-        if is_kill and HIT_CONFIRM_KILL_SOUND:
+        killed = is_kill and HIT_CONFIRM_KILL_SOUND
+        if killed:
             # Kill confirmation - use explosion/interface combination
             # Play the destruction sound first for dramatic effect
-            alog.hit_confirm(drone['id'], damage, 0, 0.8, is_kill=True)
+            vol = 0.8
+            alog.hit_confirm(drone.id, damage, 0, vol, is_kill=True)
             self._destroy_drone(drone)
-            # Additional kill confirmation sound
-            sound = self.sounds.get_drone_sound('interfaces')
-            if sound:
-                channel.set_volume(0.8 * self.audio.master_volume)
-                channel.play(sound)
-            return True
-        elif damage >= HIT_CONFIRM_DAMAGE_THRESHOLDS[2]:
-            # Massive hit (75+ damage) - loudest confirmation
-            vol = 0.9
-            alog.hit_confirm(drone['id'], damage, drone['health'], vol)
-            sound = self.sounds.get_drone_sound('interfaces')
-            if sound:
-                channel.set_volume(vol * self.audio.master_volume)
-                channel.play(sound)
-        elif damage >= HIT_CONFIRM_DAMAGE_THRESHOLDS[1]:
-            # Critical hit (50+ damage) - loud confirmation
-            vol = 0.75
-            alog.hit_confirm(drone['id'], damage, drone['health'], vol)
-            sound = self.sounds.get_drone_sound('interfaces')
-            if sound:
-                channel.set_volume(vol * self.audio.master_volume)
-                channel.play(sound)
-        elif damage >= HIT_CONFIRM_DAMAGE_THRESHOLDS[0]:
-            # Heavy hit (25+ damage) - moderate confirmation
-            vol = 0.6
-            alog.hit_confirm(drone['id'], damage, drone['health'], vol)
-            sound = self.sounds.get_drone_sound('interfaces')
-            if sound:
-                channel.set_volume(vol * self.audio.master_volume)
-                channel.play(sound)
         else:
-            # Light hit - standard feedback
-            vol = 0.4
-            alog.hit_confirm(drone['id'], damage, drone['health'], vol)
-            sound = self.sounds.get_drone_sound('interfaces')
-            if sound:
-                channel.set_volume(vol * self.audio.master_volume)
-                channel.play(sound)
+            # Scale confirmation volume with the damage tier of this hit
+            vol = _HIT_VOLUMES[bisect.bisect_right(_HIT_THRESHOLDS, damage)]
+            alog.hit_confirm(drone.id, damage, drone.health, vol)
+
+        # One confirmation tail for every tier (kill included)
+        sound = self._pick_drone_sound('interfaces')
+        if sound:
+            channel.play(sound, volume=vol * mv)
+        if killed:
+            return True
 
         # Announce critical damage thresholds
-        if drone['health'] > 0:
-            if old_health > 50 and drone['health'] <= 50:
+        if drone.health > 0:
+            if old_health > 50 and drone.health <= 50:
                 # Drone half health
                 pass  # Could add TTS: "Hostile damaged"
-            elif old_health > 25 and drone['health'] <= 25:
-                self.tts.speak("Hostile critical", duck_audio=False)
+            elif old_health > 25 and drone.health <= 25:
+                self._enqueue_tts("Hostile critical", duck_audio=False)
+
+            # One clock read per hit, shared by distress and suppression
+            # (_get_current_time goes through pygame's import each call)
+            current_time = self._get_current_time()
 
             # === DISTRESS BEACON SYSTEM ===
             if DISTRESS_BEACON_ENABLED:
                 # Trigger distress on high damage hit or low health
-                health_percent = (drone['health'] / 100.0) * 100
+                # (max health is 100, so health is already a percentage)
                 if (damage >= DISTRESS_DAMAGE_THRESHOLD or
-                    health_percent <= DISTRESS_HEALTH_THRESHOLD):
-                    if not drone['distress_active']:
-                        drone['distress_active'] = True
-                        drone['distress_start_time'] = self._get_current_time()
+                    drone.health <= DISTRESS_HEALTH_THRESHOLD):
+                    if not drone.distress_active:
+                        drone.distress_active = True
+                        drone.distress_start_time = current_time
                         self._activate_distress_beacon(drone)
 
             # === SUPPRESSION TRIGGER ===
             if SUPPRESSION_ENABLED:
-                current_time = self._get_current_time()
                 # Track recent damage for suppression calculation
-                if current_time - drone['damage_window_start'] > SUPPRESSION_TIME_WINDOW:
+                if current_time - drone.damage_window_start > SUPPRESSION_TIME_WINDOW:
                     # Reset damage window
-                    drone['damage_window_start'] = current_time
-                    drone['recent_damage'] = 0
+                    drone.damage_window_start = current_time
+                    drone.recent_damage = 0
 
-                drone['recent_damage'] += damage
+                drone.recent_damage += damage
 
                 # Check if suppressed (enough damage in time window)
-                if (drone['recent_damage'] >= SUPPRESSION_DAMAGE_THRESHOLD and
-                    not drone['is_suppressed'] and
-                    current_time >= drone['suppression_cooldown_end']):
-                    drone['is_suppressed'] = True
-                    suppression_duration = random.randint(SUPPRESSION_DURATION_MIN, SUPPRESSION_DURATION_MAX)
-                    drone['suppression_end_time'] = current_time + suppression_duration
-                    self.tts.speak("Drone suppressed")
+                if (drone.recent_damage >= SUPPRESSION_DAMAGE_THRESHOLD and
+                    not drone.is_suppressed and
+                    current_time >= drone.suppression_cooldown_end):
+                    drone.is_suppressed = True
+                    suppression_duration = _randint(SUPPRESSION_DURATION_MIN, SUPPRESSION_DURATION_MAX)
+                    drone.suppression_end_time = current_time + suppression_duration
+                    self._enqueue_tts("Drone suppressed")
 
         return False
 
+    def _pick_drone_sound(self, category: str):
+        """Pick a random sound from a drone category resolved once.
+
+        OPTIMIZATION: Per-hit and per-kill sounds skip the loader's lookup
+        chain; the category's variants are fetched on first use (after the
+        loader's lazy drone sound load) and cached as a tuple.
+
+        Args:
+            category: Drone sound category (interfaces, explosions, etc.)
+
+        Returns:
+            Sound object or None if the category has no sounds
+        """
+        variants = self._sound_variants.get(category)
+        if variants is None:
+            variants = self.sounds.get_drone_sound_variants(category)
+            self._sound_variants[category] = variants
+        return _choice(variants) if variants else None
+
     def _get_current_time(self) -> int:
         """Get current time in milliseconds (for internal use)."""
         import pygame
         return pygame.time.get_ticks()
 
-    def _activate_distress_beacon(self, drone: dict):
+    def _activate_distress_beacon(self, drone: Drone):
         """Activate distress beacon - alert nearby drones."""
         # Play distress sound from the damaged drone
         sound = self.sounds.get_drone_sound('beacons')
         if sound:
-            dc = self._get_drone_channels(drone['id'])
+            dc = drone._channels
             if dc:
                 pos = self._get_drone_3d_position(drone)
                 dc['combat'].play(sound, position_3d=pos)
 
         # Alert nearby patrol/searching drones
         for other in self.drones:
-            if other['id'] == drone['id']:
+            if other.id == drone.id:
                 continue
-            if other['state'] not in ('patrol', 'searching'):
+            if other.state not in _PASSIVE_STATES:
                 continue
-            if other['distance'] > DISTRESS_ALERT_RANGE:
+            if other.distance > DISTRESS_ALERT_RANGE:
                 continue
 
             # Drone responds to distress call
-            other['state'] = 'detecting'
-            other['state_start'] = self._get_current_time()
-            other['last_known_x'] = drone['x']
-            other['last_known_y'] = drone['y']
+            other.state = 'detecting'
+            other.state_start = self._get_current_time()
+            other.last_known_x = drone.x
+            other.last_known_y = drone.y
             # Speed boost when responding to distress
-            other['speed'] *= DISTRESS_RESPONSE_SPEED_MULT
+            other.speed *= DISTRESS_RESPONSE_SPEED_MULT
 
-    def _destroy_drone(self, drone: dict):
+    def _destroy_drone(self, drone: Drone):
         """Handle drone destruction with 3D audio positioning."""
-        drone['state'] = 'destroyed'
+        drone.state = 'destroyed'
+        self._cached_active_drones = tuple(
+            d for d in self._cached_active_drones if d is not drone
+        )
+        self._remove_from_distance_index(drone)
 
-        dc = self._get_drone_channels(drone['id'])
-        pos = self._get_drone_3d_position(drone)
+        dc = drone._channels
 
         # Stop ambient sounds immediately
         if dc and 'ambient' in dc:
             dc['ambient'].stop()
 
-        # Play explosion - use 'debris' channel if available (4-channel pool)
-        # else fall back to 'combat' channel (2-channel legacy)
-        explosion = self.sounds.get_drone_sound('explosions')
-        if explosion and dc:
-            explosion_channel = dc.get('debris', dc.get('combat'))
-            if explosion_channel:
-                explosion_channel.play(explosion, position_3d=pos)
-                self._set_3d_position(explosion_channel, drone, 'explosion')
-
-        # Play debris sound - use 'weapon' channel if available (4-channel pool)
-        # else fall back to 'ambient' channel (2-channel legacy)
-        debris = self.sounds.get_drone_sound('debris')
-        if debris and dc:
-            debris_channel = dc.get('weapon', dc.get('ambient'))
-            if debris_channel:
-                debris_channel.play(debris, position_3d=pos)
-                self._set_3d_position(debris_channel, drone, 'debris')
-
-        self.tts.speak("Hostile destroyed")
-        print(f"Drone {drone['id']} destroyed!")
-
-    def _get_active_drones_cached(self) -> list:
-        """Get cached list of active (non-destroyed) drones.
-
-        OPTIMIZATION: Only rebuilds the list once per frame when dirty flag is set.
+        # OPTIMIZATION: Past audible range the 3D explosion/debris would render
+        # near-silent, so skip the channel plays and filter setup entirely
+        if dc and drone.distance <= DRONE_AUDIBLE_RANGE:
+            pos = self._get_drone_3d_position(drone)
+
+            # Play explosion - use 'debris' channel if available (4-channel pool)
+            # else fall back to 'combat' channel (2-channel legacy)
+            explosion = self._pick_drone_sound('explosions')
+            if explosion:
+                explosion_channel = dc['debris'] if 'debris' in dc else dc.get('combat')
+                if explosion_channel:
+                    explosion_channel.play(explosion, position_3d=pos)
+                    self._set_3d_position(explosion_channel, drone, 'explosion')
+
+            # Play debris sound - use 'weapon' channel if available (4-channel pool)
+            # else fall back to 'ambient' channel (2-channel legacy)
+            debris = self._pick_drone_sound('debris')
+            if debris:
+                debris_channel = dc['weapon'] if 'weapon' in dc else dc.get('ambient')
+                if debris_channel:
+                    debris_channel.play(debris, position_3d=pos)
+                    self._set_3d_position(debris_channel, drone, 'debris')
+
+        self._enqueue_tts("Hostile destroyed")
+        if DRONE_DEBUG_PRINTS:
+            print(f"Drone {drone.id} destroyed!")
+
+    def get_active_drones(self) -> tuple:
+        """Get the active (non-destroyed) drones.
+
+        OPTIMIZATION: The tuple is maintained incrementally - spawn and destroy
+        replace it with one drone added or removed - so it is never rebuilt by
+        scanning self.drones. Being immutable, it can be handed out without
+        copying, and a caller still iterating it is unaffected by a destroy.
+        Internal per-frame code reads self._cached_active_drones directly.
         """
-        if self._active_drones_dirty:
-            self._cached_active_drones = [d for d in self.drones if d['state'] != 'destroyed']
-            self._active_drones_dirty = False
         return self._cached_active_drones
 
-    def get_active_drones(self) -> list:
-        """Get list of active (non-destroyed) drones.
+    def get_closest_drone_distance(self) -> float:
+        """Get distance to closest active drone.
 
-        Returns cached list if available (within same frame).
+        OPTIMIZATION: Reads the head of the per-frame distance index (sorted
+        closest first, destroyed drones already dropped) instead of scanning.
         """
-        return self._get_active_drones_cached()
+        dist_keys = self._dist_keys
+        return dist_keys[0] if dist_keys else 999
 
-    def get_closest_drone_distance(self) -> float:
-        """Get distance to closest active drone."""
-        active = self._get_active_drones_cached()
-        if not active:
-            return 999
-        return min(d['distance'] for d in active)
+    def _rebuild_distance_index(self):
+        """Rebuild the sorted-by-distance index of active drones.
+
+        OPTIMIZATION: Called once per frame after distances update. This one
+        sort serves every per-frame drone query: the closest distance is the
+        head of the index, while get_drones_in_range() and aim assist bisect
+        to their range cutoff instead of each scanning the active list.
+        """
+        by_distance = sorted(self._cached_active_drones, key=_distance_key)
+        self._drones_by_distance = by_distance
+        self._dist_keys = list(map(_distance_key, by_distance))
+
+    def _remove_from_distance_index(self, drone: Drone):
+        """Drop a drone from the distance index (e.g. destroyed mid-frame)."""
+        for i, d in enumerate(self._drones_by_distance):
+            if d is drone:
+                del self._drones_by_distance[i]
+                del self._dist_keys[i]
+                return
 
     def get_drones_in_range(self, range_m: float, arc: float = None) -> list:
         """Get drones within range and optional arc.
 
+        OPTIMIZATION: Bisects the per-frame distance index for the range cutoff,
+        so only drones already known to be in range are checked against the arc.
+        The arc is dispatched once per call rather than per drone, and the arc
+        test is a single chained comparison with no abs() call.
+
         Args:
             range_m: Range in meters
             arc: Optional arc in degrees (±arc from facing)
 
         Returns:
-            List of drones within range/arc
+            List of drones within range/arc, closest first
         """
-        result = []
-        for drone in self._get_active_drones_cached():
-            if drone['distance'] <= range_m:
-                if arc is None or abs(drone['relative_angle']) <= arc:
-                    result.append(drone)
-        return result
+        cut = bisect.bisect_right(self._dist_keys, range_m)
+        candidates = self._drones_by_distance[:cut]
+        if arc is None:
+            return candidates
+        neg_arc = -arc
+        return [d for d in candidates if neg_arc <= d.relative_angle <= arc]
 
     def clear_all(self):
         """Clear all drones and stop their sounds."""
         # Use pool if available, else fallback to audio manager
         if self._drone_pool:
             for drone in self.drones:
-                self._drone_pool.deactivate_drone(drone['id'])
+                self._drone_pool.deactivate_drone(drone.id)
         else:
             for dc_idx in range(self.max_drones):
                 dc = self.audio.get_drone_channels(dc_idx)
                 if dc:
                     dc['ambient'].stop()
                     dc['combat'].stop()
+        for drone in self.drones:
+            drone._channels = None
+            drone._fadeable_channels = ()
         self.drones.clear()
+        self._cached_active_drones = ()
+        self._free_drone_ids = deque(range(len(self._drone_slots)))
+        self._drones_by_distance = []
+        self._dist_keys = []
+        self._tts_queue.clear()
@@ -79,7 +79,7 @@ class RadarSystem:
             return
 
         # Sort by distance
-        sorted_drones = sorted(active_drones, key=lambda d: d['distance'])
+        sorted_drones = sorted(active_drones, key=lambda d: d.distance)
 
         # ACCESSIBILITY: Play spatialized ping for each contact with pitch indicating distance
         self._play_contact_pings(sorted_drones, current_time)
@@ -87,15 +87,15 @@ class RadarSystem:
         # Build announcements
         announcements = []
         for i, drone in enumerate(sorted_drones):
-            direction = get_direction_description(drone['relative_angle'], drone['distance'])
-            dist_meters = int(drone['distance'])
+            direction = get_direction_description(drone.relative_angle, drone.distance)
+            dist_meters = int(drone.distance)
 
             # Add health status
-            if drone['health'] <= 25:
+            if drone.health <= 25:
                 health_status = ", critical"
-            elif drone['health'] <= 50:
+            elif drone.health <= 50:
                 health_status = ", damaged"
-            elif drone['health'] <= 75:
+            elif drone.health <= 75:
                 health_status = ", wounded"
             else:
                 health_status = ""
@@ -121,14 +121,14 @@ class RadarSystem:
 
         for i, drone in enumerate(drones):
             # Calculate pitch based on distance (closer = higher pitch)
-            distance = drone['distance']
+            distance = drone.distance
             normalized_dist = min(1.0, distance / self.ECHO_MAX_DISTANCE)
             # Inverse: closer = higher pitch
             pitch = self.ECHO_PITCH_MAX - (normalized_dist * (self.ECHO_PITCH_MAX - self.ECHO_PITCH_MIN))
 
             # Get spatial positioning (use cached values)
-            pan = drone['pan']
-            vol = drone['vol']
+            pan = drone.pan
+            vol = drone.vol
 
             # Calculate play time with staggered delay
             play_time = current_time + (i * self.PING_STAGGER_MS)
@@ -20,6 +20,7 @@ Usage:
     audio.cleanup()
 """
 
+import math
 import os
 import pyfmodex
 from pyfmodex.flags import MODE
@@ -29,6 +30,11 @@ from pyfmodex.enums import DSP_TYPE
 _audio_logger = None
 _audio_log = None
 
+# Constants from state.constants, resolved on first use and reused after that
+# (lazy for the same reason as the loggers; these are read per drone per frame)
+_spatial_constants = None
+_directional_constants = None
+
 def _get_logger():
     """Get the audio logger instance (lazy initialization)."""
     global _audio_logger
@@ -846,30 +852,58 @@ class MechAudio:
     # === Directional Audio Filters ===
 
     def _get_spatial_constants(self):
-        """Get spatial audio filter constants from config or use defaults."""
-        try:
-            from state.constants import (
-                AIR_ABSORPTION_START_DISTANCE,
-                AIR_ABSORPTION_MAX_DISTANCE,
-                AIR_ABSORPTION_MAX_CUTOFF,
-                OCCLUSION_LOWPASS_CUTOFF,
-                OCCLUSION_VOLUME_REDUCTION
-            )
-            return {
-                'air_start': AIR_ABSORPTION_START_DISTANCE,
-                'air_max': AIR_ABSORPTION_MAX_DISTANCE,
-                'air_cutoff': AIR_ABSORPTION_MAX_CUTOFF,
-                'occ_cutoff': OCCLUSION_LOWPASS_CUTOFF,
-                'occ_vol': OCCLUSION_VOLUME_REDUCTION
-            }
-        except ImportError:
-            return {
-                'air_start': 10.0,
-                'air_max': 60.0,
-                'air_cutoff': 400,
-                'occ_cutoff': 2000,
-                'occ_vol': 0.7
-            }
+        """Get spatial audio filter constants from config or use defaults.
+
+        OPTIMIZATION: Resolved once and cached at module level - this is
+        called from the per-frame filter paths for every drone channel.
+        """
+        global _spatial_constants
+        if _spatial_constants is None:
+            try:
+                from state.constants import (
+                    AIR_ABSORPTION_START_DISTANCE,
+                    AIR_ABSORPTION_MAX_DISTANCE,
+                    AIR_ABSORPTION_MAX_CUTOFF,
+                    OCCLUSION_LOWPASS_CUTOFF,
+                    OCCLUSION_VOLUME_REDUCTION
+                )
+                _spatial_constants = {
+                    'air_start': AIR_ABSORPTION_START_DISTANCE,
+                    'air_max': AIR_ABSORPTION_MAX_DISTANCE,
+                    'air_cutoff': AIR_ABSORPTION_MAX_CUTOFF,
+                    'occ_cutoff': OCCLUSION_LOWPASS_CUTOFF,
+                    'occ_vol': OCCLUSION_VOLUME_REDUCTION
+                }
+            except ImportError:
+                _spatial_constants = {
+                    'air_start': 10.0,
+                    'air_max': 60.0,
+                    'air_cutoff': 400,
+                    'occ_cutoff': 2000,
+                    'occ_vol': 0.7
+                }
+        return _spatial_constants
+
+    def _get_directional_constants(self):
+        """Get rear-filter constants from config or use defaults (cached).
+
+        Returns:
+            Tuple of (rear_cutoff, rear_start_angle, rear_vol_reduction, interp_speed)
+        """
+        global _directional_constants
+        if _directional_constants is None:
+            try:
+                from state.constants import (
+                    REAR_LOWPASS_CUTOFF, REAR_LOWPASS_START_ANGLE,
+                    REAR_VOLUME_REDUCTION, OCCLUSION_INTERPOLATION_SPEED
+                )
+                _directional_constants = (
+                    REAR_LOWPASS_CUTOFF, REAR_LOWPASS_START_ANGLE,
+                    REAR_VOLUME_REDUCTION, OCCLUSION_INTERPOLATION_SPEED
+                )
+            except ImportError:
+                _directional_constants = (2500, 90, 0.15, 8.0)
+        return _directional_constants
 
     def create_channel_lowpass_dsp(self):
         """Create a lowpass DSP for per-channel use.
@@ -1003,20 +1037,8 @@ class MechAudio:
                 return
 
             # Get enhanced audio constants
-            try:
-                from state.constants import (
-                    REAR_LOWPASS_CUTOFF, REAR_LOWPASS_START_ANGLE,
-                    REAR_VOLUME_REDUCTION, OCCLUSION_INTERPOLATION_SPEED
-                )
-                rear_cutoff = REAR_LOWPASS_CUTOFF
-                rear_start_angle = REAR_LOWPASS_START_ANGLE
-                rear_vol_reduction = REAR_VOLUME_REDUCTION
-                interp_speed = OCCLUSION_INTERPOLATION_SPEED
-            except ImportError:
-                rear_cutoff = 2500
-                rear_start_angle = 90
-                rear_vol_reduction = 0.15
-                interp_speed = 8.0
+            (rear_cutoff, rear_start_angle,
+             rear_vol_reduction, interp_speed) = self._get_directional_constants()
 
             # === ENHANCED Directional Lowpass (Head Shadow) ===
             abs_angle = abs(relative_angle)
@@ -1217,8 +1239,6 @@ class MechAudio:
         Returns:
             Tuple of (relative_angle, altitude_diff_meters, distance_meters)
         """
-        import math
-
         dx = source_x - listener_x
         dy = source_y - listener_y
 
@@ -1264,8 +1284,6 @@ class MechAudio:
                 - relative_angle: Angle from listener's facing (-180 to 180)
                 - altitude_diff: Altitude difference in feet (positive = above)
         """
-        import math
-
         # Calculate horizontal distance
         dx = source_x - listener_x
         dy = source_y - listener_y
@@ -1846,6 +1864,12 @@ class FMODChannelWrapper:
     Enhanced with crossfade support for smooth sound transitions.
     """
 
+    # Capability flags - per-frame callers test these instead of hasattr()
+    # probes (plain pygame channels lack them and read as False via getattr)
+    can_fade = True
+    can_set_pitch = True
+    can_position_3d = True
+
     def __init__(self, audio_system, group_name=None, name=None, is_3d=False):
         """Create a channel wrapper.
 
@@ -1875,7 +1899,8 @@ class FMODChannelWrapper:
         self._pending_params = {}  # Parameters for pending sound
         self._stop_after_fade = False  # Stop channel after fade out completes
 
-    def play(self, sound, loops=0, mono_downmix=False, position_3d=None, velocity=None):
+    def play(self, sound, loops=0, mono_downmix=False, position_3d=None, velocity=None,
+             volume=None):
         """Play a sound on this channel.
 
         Args:
@@ -1884,6 +1909,9 @@ class FMODChannelWrapper:
             mono_downmix: If True, downmix stereo to mono for proper 3D positioning
             position_3d: Optional (x, y, z) tuple for 3D sounds - sets position before playing
             velocity: Optional (vx, vy, vz) tuple for Doppler effect
+            volume: Optional mono volume to store before playing. Equivalent to
+                set_volume() followed by play(), without first applying the
+                volume to the sound being replaced
 
         Returns:
             self for chaining
@@ -1891,6 +1919,11 @@ class FMODChannelWrapper:
         # Stop any currently playing sound
         self.stop()
 
+        if volume is not None:
+            self._volume = volume
+            self._left_vol = volume
+            self._right_vol = volume
+
         # For 3D sounds, start paused so we can set position first
         start_paused = (self._is_3d and position_3d is not None)
 
@@ -218,12 +218,17 @@ DRONE_DETECT_RANGE = 25
 DRONE_LOSE_TRACK_RANGE = 50
 DRONE_REACQUIRE_RANGE = 35
 DRONE_ATTACK_RANGE = 40
+DRONE_AUDIBLE_RANGE = 80.0  # Destroy and patrol audio skipped beyond this distance
 
 # Drone detection ranges (with camo)
 DRONE_CAMO_DETECT_RANGE = 5
 DRONE_CAMO_LOSE_TRACK_RANGE = 15
 DRONE_CAMO_REACQUIRE_RANGE = 10
 
+# Drone update level of detail (passive drones beyond DRONE_ATTACK_RANGE)
+DRONE_LOD_MEDIUM_RATE = 4  # Update every 4th frame inside AUDIO_DISTANCE_FAR
+DRONE_LOD_FAR_RATE = 10    # Update every 10th frame beyond AUDIO_DISTANCE_FAR
+
 # Drone weapon stats (extended burst patterns 4-12 shots)
 DRONE_WEAPONS = {
     'pulse_cannon': {
@@ -260,6 +265,7 @@ DRONE_WEAPONS = {
 
 RADAR_COOLDOWN = 2000  # Milliseconds
 AIM_ASSIST_COOLDOWN = 500  # Milliseconds
+AIM_ASSIST_RANGE = 40  # Meters - drones beyond this never trigger aim assist
 TARGET_LOCK_ANGLE = 5  # Degrees - direct lock when within this angle
 TARGET_LOCK_COOLDOWN = 300  # Milliseconds - faster feedback for direct lock
 
@@ -586,6 +592,12 @@ AUDIO_SPEED_THRESHOLD = 5.0  # Speed above which drone sounds more aggressive
 AUDIO_SPEED_PITCH_BOOST = 0.1  # Additional pitch when drone moving fast
 AUDIO_SPEED_VOLUME_BOOST = 0.15  # Additional volume when drone moving fast
 
+# Per-drone spatial/pitch audio log entries are written every Nth frame (1 = every frame)
+AUDIO_LOG_SAMPLE_RATE = 10
+
+# Print drone spawn/destroy/attack summaries to the console (debugging aid)
+DRONE_DEBUG_PRINTS = False
+
 # =============================================================================
 # ENVIRONMENTAL AUDIO DEPTH
 # =============================================================================
@@ -125,13 +125,13 @@ class CamouflageSystem:
             current_time: Current game time
         """
         for drone in drone_manager.drones:
-            if drone['state'] in ('detecting', 'engaging', 'winding_up'):
-                if drone['distance'] > CAMO_CONFUSION_LOSE_LOCK_RANGE:
+            if drone.state in ('detecting', 'engaging', 'winding_up'):
+                if drone.distance > CAMO_CONFUSION_LOSE_LOCK_RANGE:
                     # Drone loses lock - enters brief confusion
-                    drone['confused_until'] = current_time + CAMO_CONFUSION_DURATION
-                    drone['state'] = 'searching'
-                    drone['state_start'] = current_time
-                    print(f"Drone {drone['id']} confused by camo break")
+                    drone.confused_until = current_time + CAMO_CONFUSION_DURATION
+                    drone.state = 'searching'
+                    drone.state_start = current_time
+                    print(f"Drone {drone.id} confused by camo break")
 
     def update(self, current_time: int, dt: float, drone_manager=None):
         """Update camouflage energy and reveal status.
@@ -189,10 +189,10 @@ class CamouflageSystem:
         closest_drone = None
 
         for drone in drone_manager.drones:
-            if drone['state'] in ('spawning', 'destroyed'):
+            if drone.state in ('spawning', 'destroyed'):
                 continue
-            if drone['distance'] < closest_distance:
-                closest_distance = drone['distance']
+            if drone.distance < closest_distance:
+                closest_distance = drone.distance
                 closest_drone = drone
 
         # Play warning if drone within proximity range
@@ -219,10 +219,10 @@ class CamouflageSystem:
             lose_range: Distance beyond which drones lose track
         """
         for drone in drone_manager.drones:
-            if drone['state'] in ('detecting', 'engaging') and drone['distance'] > lose_range:
-                drone['state'] = 'searching'
-                drone['state_start'] = current_time
-                print(f"Drone {drone['id']} lost track due to camo")
+            if drone.state in ('detecting', 'engaging') and drone.distance > lose_range:
+                drone.state = 'searching'
+                drone.state_start = current_time
+                print(f"Drone {drone.id} lost track due to camo")
 
     @property
     def is_active(self) -> bool:
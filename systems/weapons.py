@@ -202,7 +202,7 @@ class WeaponSystem:
             if random.random() < CHAINGUN_HIT_CHANCE:
                 targets = self.drones.get_drones_in_range(CHAINGUN_RANGE, CHAINGUN_ARC)
                 if targets:
-                    target = min(targets, key=lambda d: d['distance'])
+                    target = min(targets, key=lambda d: d.distance)
                     damage = self._get_ambush_damage(CHAINGUN_DAMAGE)
                     self.drones.damage_drone(target, damage)
                     print(f"{gun_name}: Hit!")
@@ -275,8 +275,8 @@ class WeaponSystem:
         self.state.missile_target_count = len(targets)
 
         if targets:
-            closest = min(targets, key=lambda d: d['distance'])
-            self.state.missile_closest_distance = closest['distance']
+            closest = min(targets, key=lambda d: d.distance)
+            self.state.missile_closest_distance = closest.distance
 
             # Distance-based lock time: closer = faster
             distance_ratio = self.state.missile_closest_distance / MISSILE_RANGE
@@ -354,7 +354,7 @@ class WeaponSystem:
 
         # Hit drones in range
         targets = self.drones.get_drones_in_range(MISSILE_RANGE)
-        targets = sorted(targets, key=lambda d: d['distance'])
+        targets = sorted(targets, key=lambda d: d.distance)
         missiles_remaining = MISSILE_COUNT
         hits = 0
         # First missile gets ambush bonus
@@ -392,7 +392,7 @@ class WeaponSystem:
                     # Hit closest drone in tight arc
                     targets = self.drones.get_drones_in_range(BLASTER_RANGE, BLASTER_ARC)
                     if targets:
-                        target = min(targets, key=lambda d: d['distance'])
+                        target = min(targets, key=lambda d: d.distance)
                         damage = self._get_ambush_damage(BLASTER_DAMAGE)
                         self.drones.damage_drone(target, damage)
                         self.tts.speak("Direct hit")